@@ -0,0 +1,184 @@
+# standard packages
+import gzip
+import lzma
+import pickle
+import sys
+from argparse import ArgumentParser, Namespace
+from mmap import mmap, ACCESS_READ
+from os import makedirs, cpu_count
+from os.path import abspath, dirname, join, getsize
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+
+# the library modules import each other by module name, the pattern generator is shared with the tests
+sys.path.insert(0, join(dirname(dirname(abspath(__file__))), "stil_parser_lib"))
+sys.path.insert(0, join(dirname(dirname(abspath(__file__))), "tests"))
+
+
+# optional packages
+try:
+    import zstandard
+except ModuleNotFoundError:
+    zstandard = None
+
+
+# local packages
+from stil_parser import StilParser
+from stil_signal_index import StilSignalIndex
+from stil_test import StilTest
+from stil_trace import StilTrace
+from stil_trace_compare import StilTraceCompare
+from gen_stil import gen_stil_str, parse_stil
+
+
+def time_best(function: Callable[[], object], repeat: int) -> float:
+    time_list: List[float] = []
+    for _ in range(repeat):
+        start: float = perf_counter()
+        function()
+        time_list.append(perf_counter() - start)
+    return min(time_list)
+
+
+def read_lines(file_path: str) -> None:
+    with StilParser.open_stil_file(file_path=file_path) as stil_file:
+        for _ in stil_file:
+            pass
+
+
+def bench_compression(directory: str, stil_str: str, repeat: int) -> None:
+    stil_bytes: bytes = stil_str.encode()
+    compress_dict: Dict[str, Optional[Callable[[bytes], bytes]]] = {
+        ".stil": lambda data: data,
+        ".stil.gz": gzip.compress,
+        ".stil.xz": lzma.compress,
+        ".stil.zst": None if zstandard is None else zstandard.ZstdCompressor().compress,
+    }
+    print(f"compression, '{len(stil_bytes)/1e6:.1f}' MB of stil text")
+    for suffix, compress in compress_dict.items():
+        if compress is None:
+            print(f"\t{suffix}: skipped, zstandard is not installed")
+            continue
+        format_dir: str = join(directory, suffix.strip("."))
+        file_path: str = join(format_dir, f"gen_test{suffix}")
+        makedirs(format_dir, exist_ok=True)
+        with open(file_path, "wb") as stil_file:
+            stil_file.write(compress(stil_bytes))
+        read_time: float = time_best(lambda: read_lines(file_path=file_path), repeat=repeat)
+        parse_time: float = time_best(lambda: parse_stil(directory=format_dir, stil="gen_test"), repeat=repeat)
+        print(
+            f"\t{suffix}: file '{getsize(file_path)/1e6:.1f}' MB, "
+            f"read '{len(stil_bytes)/1e6/read_time:.0f}' MB/s, "
+            f"parse '{len(stil_bytes)/1e6/parse_time:.1f}' MB/s ({parse_time:.2f} s)"
+        )
+
+
+def bench_mmap(directory: str, stil_str: str, repeat: int) -> None:
+    mmap_dir: str = join(directory, "mmap")
+    makedirs(mmap_dir, exist_ok=True)
+    with open(join(mmap_dir, "gen_test.stil"), "w") as stil_file:
+        stil_file.write(stil_str)
+
+    print(f"mmap, '{len(stil_str)/1e6:.1f}' MB of stil text")
+    text_time: float = time_best(lambda: parse_stil(directory=mmap_dir, stil="gen_test"), repeat=repeat)
+    mmap_time: float = time_best(lambda: parse_stil(directory=mmap_dir, stil="gen_test", use_mmap=True), repeat=repeat)
+    print(f"\tparse: text '{text_time:.2f}' s, mmap '{mmap_time:.2f}' s")
+
+    # building the test vectors is shared by both paths, dropping it leaves the scanning of the pattern section
+    add_test_vector: Callable[..., None] = StilTest.add_test_vector
+    StilTest.add_test_vector = lambda self, tester_cycle, signal_group_name, value_str: None
+    try:
+        text_time = time_best(lambda: parse_stil(directory=mmap_dir, stil="gen_test"), repeat=repeat)
+        mmap_time = time_best(lambda: parse_stil(directory=mmap_dir, stil="gen_test", use_mmap=True), repeat=repeat)
+    finally:
+        StilTest.add_test_vector = add_test_vector
+    print(f"\tscan only: text '{text_time:.2f}' s, mmap '{mmap_time:.2f}' s")
+
+
+def load_chunk_list(file_path: str, chunk_count: int) -> float:
+    # runs the workers in this process, then times what the parent process does with their results
+    stil_test: StilTest = StilTest()
+    with open(file_path, "rb") as raw_file, mmap(raw_file.fileno(), 0, access=ACCESS_READ) as stil_buffer:
+        stil_test = StilParser._parse_stil_header_buffer(stil_test=stil_test, stil_buffer=stil_buffer)
+        chunk_list: List[Tuple[int, int, int]] = StilParser._split_test_vector_buffer(
+            stil_buffer=stil_buffer, start=stil_buffer.tell(), end=len(stil_buffer), chunk_count=chunk_count
+        )
+    StilParser._init_chunk_worker(file_path=file_path, stil_test=pickle.loads(pickle.dumps(stil_test)))
+    test_vector_dict_bytes_list: List[bytes] = [StilParser._parse_test_vector_chunk(chunk) for chunk in chunk_list]
+
+    start: float = perf_counter()
+    merged_tester_cycle_set: Set[int] = set()
+    for test_vector_dict_bytes in test_vector_dict_bytes_list:
+        merged_tester_cycle_set.update(StilParser._load_test_vector_chunk(stil_test=stil_test, test_vector_dict_bytes=test_vector_dict_bytes))
+    for tester_cycle in merged_tester_cycle_set:
+        stil_test.test_vector_dict[tester_cycle].sort()
+    stil_test.sort(sort_test_vectors=False)
+    return perf_counter() - start
+
+
+def bench_parallel(directory: str, stil_str: str, repeat: int) -> None:
+    parallel_dir: str = join(directory, "parallel")
+    makedirs(parallel_dir, exist_ok=True)
+    file_path: str = join(parallel_dir, "gen_test.stil")
+    with open(file_path, "w") as stil_file:
+        stil_file.write(stil_str)
+
+    print(f"parallel, '{len(stil_str)/1e6:.1f}' MB of stil text, '{cpu_count()}' cores")
+    sequential_time: float = time_best(lambda: parse_stil(directory=parallel_dir, stil="gen_test", use_mmap=True), repeat=repeat)
+    print(f"\tsequential mmap: '{sequential_time:.2f}' s")
+    process_count: int = 2
+    while process_count <= max(cpu_count() or 1, 2):
+        parallel_time: float = time_best(lambda: parse_stil(directory=parallel_dir, stil="gen_test", process_count=process_count), repeat=repeat)
+        print(f"\tprocess count '{process_count}': '{parallel_time:.2f}' s, speedup '{sequential_time/parallel_time:.2f}'")
+        process_count*=2
+
+    load_time: float = min(load_chunk_list(file_path=file_path, chunk_count=8*StilParser.CHUNK_PER_PROCESS) for _ in range(repeat))
+    print(f"\tserial load and merge in the parent process: '{load_time:.2f}' s")
+
+
+def bench_compare(directory: str, stil_str: str, repeat: int) -> None:
+    compare_dir: str = join(directory, "compare")
+    makedirs(compare_dir, exist_ok=True)
+    with open(join(compare_dir, "gen_test.stil"), "w") as stil_file:
+        stil_file.write(stil_str)
+    stil_test: StilTest = parse_stil(directory=compare_dir, stil="gen_test", use_mmap=True)
+
+    # the trace follows every event of the test, so every compare passes
+    index_time: float = time_best(lambda: StilSignalIndex(period=stil_test.waveform_table.period, test_vector_dict=stil_test.test_vector_dict), repeat=repeat)
+    stil_trace: StilTrace = StilTrace(timescale=1, units=stil_test.waveform_table.units)
+    for signal_name, time_array in stil_test.signal_index.time_array_dict.items():
+        value_str: str = stil_test.signal_index.value_str_dict[signal_name].translate(str.maketrans("UDNHLXT", "10x10xz"))
+        stil_trace.add_signal_trace(signal_name=signal_name, time_list=time_array, value_list=value_str)
+
+    compare_count: int = StilTraceCompare.compare_trace(stil_test=stil_test, stil_trace=stil_trace).compare_count
+    compare_time: float = time_best(lambda: StilTraceCompare.compare_trace(stil_test=stil_test, stil_trace=stil_trace), repeat=repeat)
+    print(f"compare, '{compare_count}' compares")
+    print(f"\tsignal index: '{index_time:.2f}' s, compare: '{compare_time:.2f}' s, '{compare_count/compare_time/1e6:.2f}' M compares/s")
+    print(f"\tprojected for 10M compares: '{10e6*(index_time + compare_time)/compare_count:.1f}' s with the index, '{10e6*compare_time/compare_count:.1f}' s without")
+
+
+BENCH_DICT: Dict[str, Callable[[str, str, int], None]] = {
+    "compression": bench_compression,
+    "mmap": bench_mmap,
+    "parallel": bench_parallel,
+    "compare": bench_compare,
+}
+
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(description="Times the stil parser on a generated pattern")
+    argument_parser.add_argument("bench", nargs="*", choices=list(BENCH_DICT.keys()), default=list(BENCH_DICT.keys()))
+    argument_parser.add_argument("--cycle-count", type=int, default=100000)
+    argument_parser.add_argument("--repeat", type=int, default=3)
+    args: Namespace = argument_parser.parse_args()
+
+    stil_str: str = gen_stil_str(cycle_count=args.cycle_count)
+    with TemporaryDirectory() as directory:
+        for bench in args.bench:
+            BENCH_DICT[bench](directory, stil_str, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
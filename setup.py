@@ -5,5 +5,6 @@ setup(
     packages=find_packages(include=["stil_parser_lib"]),
     version='0.1.0',
     description='STIL file parser',
+    extras_require={'zstd': ['zstandard']},
     author='Florent Cournoyer'
 )
@@ -1,71 +1,446 @@
 # standard packages
-from io import TextIOWrapper
-from typing import Optional, List, Tuple, Match
-from re import search, findall
+import gzip
+import lzma
+from asyncio import AbstractEventLoop, Queue, get_running_loop
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from io import TextIOWrapper, BytesIO
+from pickle import Pickler, Unpickler, UnpicklingError, HIGHEST_PROTOCOL
+from mmap import mmap, ACCESS_READ
+from os.path import isfile
+from queue import Queue as SyncQueue, Full
+from threading import Event, Semaphore, Thread
+from typing import Callable, Optional, List, Tuple, Match, Iterator, AsyncIterator, TextIO, BinaryIO, Pattern, Dict, Any, Union, Set
+from re import search, findall, compile, MULTILINE
+
+
+# optional packages
+try:
+    import zstandard
+except ModuleNotFoundError:
+    zstandard = None
 
 
 # local packages
+from stil_signal import StilSignal
 from stil_test import StilTest
-   
+from stil_test_cache import StilTestCache
+from stil_test_vector import StilTestVector
+from stil_waveform_table import StilWaveformTable
+
+
+class _StilTestVectorPickler(Pickler):
+    # signals and the waveform table are sent by reference and rebound to the parent process objects by _StilTestVectorUnpickler
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, ...]]:
+        # called for every pickled object, exact type checks are the cheapest way out for the others
+        obj_type: type = type(obj)
+        if obj_type is StilSignal:
+            return ("signal", obj.name)
+        if obj_type is StilWaveformTable:
+            return ("waveform_table",)
+        return None
+
+
+class _StilTestVectorUnpickler(Unpickler):
+    def __init__(self, file: BytesIO, stil_test: StilTest) -> None:
+        super().__init__(file)
+        self._stil_test: StilTest = stil_test
+
+
+    def persistent_load(self, pid: Tuple[str, ...]) -> Union[StilSignal, StilWaveformTable]:
+        if pid[0] == "signal":
+            return self._stil_test.signal_dict[pid[1]]
+        if pid[0] == "waveform_table":
+            return self._stil_test.waveform_table
+        raise UnpicklingError(f"Unknown persistent id '{pid}'")
+
 
 class StilParser():
+    STIL_SUFFIX_LIST: Tuple[str, ...] = (".stil", ".stil.gz", ".stil.xz", ".stil.zst")
+    GZIP_MAGIC: bytes = b"\x1f\x8b"
+    XZ_MAGIC: bytes = b"\xfd7zXZ\x00"
+    ZSTD_MAGIC: bytes = b"\x28\xb5\x2f\xfd"
+    COMPRESSION_MAGIC_DICT: Dict[str, bytes] = {"gzip": GZIP_MAGIC, "xz": XZ_MAGIC, "zstd": ZSTD_MAGIC}
+    VECTOR_BLOCK_REGEX: Pattern[bytes] = compile(rb"^[ \t]*V \{[ \t\r]*$", MULTILINE)
+    TESTER_CYCLE_REGEX: Pattern[bytes] = compile(rb"TesterCycle:(\d+)")
+    # each match starts on a newline and covers one line: the opening or closing line of a V block, a signal group assignment,
+    # a TesterCycle annotation or any other line, the leading newline lets the regex engine skip straight to the next line
+    PATTERN_TOKEN_REGEX: Pattern[bytes] = compile(
+        rb"\n[ \t]*(?:(V \{|\})[ \t\r]*(?![^\n])|([^\s=;{}]+)[ \t]*=[ \t]*([^\s=;]+)[ \t]*;?[ \t\r]*(?![^\n])|[^\n]*?TesterCycle:(\d+)|([^\n]*))"
+    )
+    PATTERN_WINDOW_SIZE: int = 1 << 20
+    CHUNK_PER_PROCESS: int = 4
+    PRODUCER_POLL_PERIOD: float = 0.1
+    PRODUCER_THREAD_NAME: str = "StilParser producer"
+
+    _chunk_worker_stil_test: Optional[StilTest] = None
+    _chunk_worker_file_path: Optional[str] = None
 
 
     @staticmethod
-    def gen_tests_from_stil(directory_list: List[str]=[], stil_list: List[str]=[]) -> List[StilTest]:
+    def gen_tests_from_stil(
+        directory_list: List[str]=[],
+        stil_list: List[str]=[],
+        use_mmap: bool=False,
+        process_count: int=1,
+        stil_test_cache: Optional[StilTestCache]=None) -> List[StilTest]:
+
         stil_test_list: List[StilTest] = []
-        stil_file: Optional[TextIOWrapper] = None
         for directory in directory_list:
             for stil in stil_list:
                 try:
-                    file_path: str = f"{directory}/{stil}.stil"
-                    stil_file = open(file_path)
-                    stil_test_list.append(StilParser._parse_stil_file(stil_file=stil_file))
+                    file_path: str = StilParser._find_stil_file(directory=directory, stil=stil)
+                    stil_test: Optional[StilTest] = None
+                    if stil_test_cache is not None:
+                        stil_test = stil_test_cache.get_test(file_path=file_path)
+                    if stil_test is None:
+                        stil_test = StilParser._parse_stil_path(file_path=file_path, use_mmap=use_mmap, process_count=process_count)
+                        if stil_test_cache is not None:
+                            stil_test_cache.add_test(file_path=file_path, stil_test=stil_test)
+                    stil_test_list.append(stil_test)
                 except (FileNotFoundError, NotADirectoryError):
                     continue
-            if stil_file is not None:
-                stil_file.close()
-                stil_file = None
         return stil_test_list
 
 
     @staticmethod
-    def _parse_stil_file(stil_file: TextIOWrapper) -> StilTest:
+    def _parse_stil_path(file_path: str, use_mmap: bool, process_count: int) -> StilTest:
+        with open(file_path, "rb") as raw_file:
+            compression: Optional[str] = StilParser._get_compression(raw_file=raw_file)
+            if process_count > 1 and compression is None:
+                return StilParser._parse_stil_file_parallel(file_path=file_path, raw_file=raw_file, process_count=process_count)
+            if use_mmap and compression is None:
+                return StilParser._parse_stil_file_mmap(raw_file=raw_file)
+            with StilParser._open_stil_stream(raw_file=raw_file, compression=compression) as stil_file:
+                return StilParser._parse_stil_file(stil_file=stil_file)
+
+
+    @staticmethod
+    def iter_stil(file_path: str, queue_depth: int=64) -> Iterator[StilTestVector]:
+        if queue_depth < 1:
+            raise ValueError(f"Queue depth must be at least 1, got '{queue_depth}'")
+        # a thread-safe queue does not depend on an event loop, so the generator also runs from cocotb coroutines
+        queue: "SyncQueue[Union[StilTestVector, Exception, None]]" = SyncQueue(maxsize=queue_depth)
+        stop_event: Event = Event()
+        StilParser._start_producer(
+            file_path=file_path,
+            put_item=partial(StilParser._put_blocking, queue=queue, stop_event=stop_event)
+        )
+
+        try:
+            while True:
+                item: Union[StilTestVector, Exception, None] = queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop_event.set()
+
+
+    @staticmethod
+    async def aiter_stil(file_path: str, queue_depth: int=64) -> AsyncIterator[StilTestVector]:
+        if queue_depth < 1:
+            raise ValueError(f"Queue depth must be at least 1, got '{queue_depth}'")
+        try:
+            loop: AbstractEventLoop = get_running_loop()
+        except RuntimeError:
+            # not on an asyncio event loop, e.g. in a cocotb coroutine: nothing can be awaited here, so the consumer blocks on the queue
+            test_vector_iter: Iterator[StilTestVector] = StilParser.iter_stil(file_path=file_path, queue_depth=queue_depth)
+            try:
+                for test_vector in test_vector_iter:
+                    yield test_vector
+            finally:
+                test_vector_iter.close()
+            return
+
+        queue: "Queue[Union[StilTestVector, Exception, None]]" = Queue()
+        # the producer takes a slot before each put and the consumer gives it back after each get
+        slot_semaphore: Semaphore = Semaphore(queue_depth)
+        stop_event: Event = Event()
+        StilParser._start_producer(
+            file_path=file_path,
+            put_item=partial(StilParser._put_threadsafe, loop=loop, queue=queue, slot_semaphore=slot_semaphore, stop_event=stop_event)
+        )
+
+        try:
+            while True:
+                item = await queue.get()
+                slot_semaphore.release()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop_event.set()
+
+
+    @staticmethod
+    def _start_producer(file_path: str, put_item: Callable[[Union[StilTestVector, Exception, None]], bool]) -> None:
+        Thread(
+            target=StilParser._produce_test_vector,
+            kwargs={"file_path": file_path, "put_item": put_item},
+            name=f"{StilParser.PRODUCER_THREAD_NAME} '{file_path}'",
+            daemon=True
+        ).start()
+
+
+    @staticmethod
+    def _produce_test_vector(file_path: str, put_item: Callable[[Union[StilTestVector, Exception, None]], bool]) -> None:
+        # put_item returns False once the consumer has stopped
+        last_item: Union[Exception, None] = None
+        try:
+            with StilParser.open_stil_file(file_path=file_path) as stil_file:
+                stil_test: StilTest = StilTest()
+                line_iter: Iterator[Tuple[int, str]] = enumerate(stil_file)
+                stil_test = StilParser._parse_stil_header(stil_test=stil_test, line_iter=line_iter)
+                for test_vector in StilParser._iter_test_vector(stil_test=stil_test, line_iter=line_iter):
+                    if not put_item(test_vector):
+                        return
+        except Exception as e:
+            last_item = e
+        put_item(last_item)
+
+
+    @staticmethod
+    def _put_blocking(item: Union[StilTestVector, Exception, None], queue: "SyncQueue[Union[StilTestVector, Exception, None]]", stop_event: Event) -> bool:
+        while not stop_event.is_set():
+            try:
+                queue.put(item, timeout=StilParser.PRODUCER_POLL_PERIOD)
+                return True
+            except Full:
+                pass
+        return False
+
+
+    @staticmethod
+    def _put_threadsafe(item: Union[StilTestVector, Exception, None], loop: AbstractEventLoop, queue: "Queue[Union[StilTestVector, Exception, None]]", slot_semaphore: Semaphore, stop_event: Event) -> bool:
+        while not slot_semaphore.acquire(timeout=StilParser.PRODUCER_POLL_PERIOD):
+            if stop_event.is_set():
+                return False
+        if stop_event.is_set():
+            return False
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # the event loop was closed while the consumer was waiting
+            return False
+        return True
+
+
+    @staticmethod
+    @contextmanager
+    def open_stil_file(file_path: str) -> Iterator[TextIO]:
+        with open(file_path, "rb") as raw_file:
+            compression: Optional[str] = StilParser._get_compression(raw_file=raw_file)
+            with StilParser._open_stil_stream(raw_file=raw_file, compression=compression) as stil_file:
+                yield stil_file
+
+
+    @staticmethod
+    def _get_compression(raw_file: BinaryIO) -> Optional[str]:
+        magic: bytes = raw_file.read(len(StilParser.XZ_MAGIC))
+        raw_file.seek(0)
+        for compression, compression_magic in StilParser.COMPRESSION_MAGIC_DICT.items():
+            if magic.startswith(compression_magic):
+                return compression
+        return None
+
+
+    @staticmethod
+    def _open_stil_stream(raw_file: BinaryIO, compression: Optional[str]) -> TextIO:
+        # the decompressors do not close raw_file, it stays owned by the caller
+        if compression == "gzip":
+            return TextIOWrapper(gzip.GzipFile(fileobj=raw_file, mode="rb"))
+        if compression == "xz":
+            return TextIOWrapper(lzma.LZMAFile(raw_file))
+        if compression == "zstd":
+            if zstandard is None:
+                raise ModuleNotFoundError(f"Module 'zstandard' is required to read zstd-compressed file '{raw_file.name}'")
+            return TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw_file, read_across_frames=True, closefd=False))
+        return TextIOWrapper(raw_file)
+
+
+    @staticmethod
+    def _find_stil_file(directory: str, stil: str) -> str:
+        for suffix in StilParser.STIL_SUFFIX_LIST:
+            file_path: str = f"{directory}/{stil}{suffix}"
+            if isfile(file_path):
+                return file_path
+        raise FileNotFoundError(f"Could not find '{stil}' with any of the suffixes '{StilParser.STIL_SUFFIX_LIST}' in directory '{directory}'")
+
+
+    @staticmethod
+    def _parse_stil_file(stil_file: TextIO) -> StilTest:
         stil_test: StilTest = StilTest()
-        line_list: List[str] = stil_file.readlines()
-        line_idx: int = 0
+        line_iter: Iterator[Tuple[int, str]] = enumerate(stil_file)
+
+        stil_test = StilParser._parse_stil_header(    stil_test=stil_test, line_iter=line_iter )
+        stil_test = StilParser._parse_test_vector(    stil_test=stil_test, line_iter=line_iter )
+
+        return stil_test
+
 
-        stil_test, line_idx = StilParser._parse_test_name(      stil_test=stil_test, line_list=line_list, line_idx=line_idx )
-        stil_test, line_idx = StilParser._parse_signals(        stil_test=stil_test, line_list=line_list, line_idx=line_idx )
-        stil_test, line_idx = StilParser._parse_signal_groups(  stil_test=stil_test, line_list=line_list, line_idx=line_idx )
-        stil_test, line_idx = StilParser._parse_waveform_table( stil_test=stil_test, line_list=line_list, line_idx=line_idx )
-        stil_test, line_idx = StilParser._parse_waveforms(      stil_test=stil_test, line_list=line_list, line_idx=line_idx )
-        stil_test, line_idx = StilParser._parse_test_vector(    stil_test=stil_test, line_list=line_list, line_idx=line_idx )
+    @staticmethod
+    def _parse_stil_header(stil_test: StilTest, line_iter: Iterator[Tuple[int, str]]) -> StilTest:
+        stil_test = StilParser._parse_test_name(      stil_test=stil_test, line_iter=line_iter )
+        stil_test = StilParser._parse_signals(        stil_test=stil_test, line_iter=line_iter )
+        stil_test = StilParser._parse_signal_groups(  stil_test=stil_test, line_iter=line_iter )
+        stil_test = StilParser._parse_waveform_table( stil_test=stil_test, line_iter=line_iter )
+        stil_test = StilParser._parse_waveforms(      stil_test=stil_test, line_iter=line_iter )
 
         return stil_test
 
 
     @staticmethod
-    def _parse_test_name(stil_test: StilTest, line_list: List[str], line_idx: int) -> Tuple[StilTest, int]:
-        while "Title " not in line_list[line_idx]:
-            line_idx+=1
+    def _parse_stil_header_buffer(stil_test: StilTest, stil_buffer: mmap) -> StilTest:
+        # the header is small and goes through the text path, mmap.readline() leaves the buffer positioned after the waveforms block
+        line_iter: Iterator[Tuple[int, str]] = enumerate(line.decode() for line in iter(stil_buffer.readline, b""))
+        return StilParser._parse_stil_header(stil_test=stil_test, line_iter=line_iter)
+
+
+    @staticmethod
+    def _parse_stil_file_mmap(raw_file: BinaryIO) -> StilTest:
+        stil_test: StilTest = StilTest()
+        with mmap(raw_file.fileno(), 0, access=ACCESS_READ) as stil_buffer:
+            stil_test = StilParser._parse_stil_header_buffer(stil_test=stil_test, stil_buffer=stil_buffer)
+            stil_test, _ = StilParser._parse_test_vector_buffer(
+                stil_test=stil_test,
+                stil_buffer=stil_buffer,
+                start=stil_buffer.tell(),
+                end=len(stil_buffer),
+                tester_cycle=0
+            )
 
-        test_name: Optional[Match[str]] = search(r'"(.*?)"', line_list[line_idx])
+        stil_test.sort()
+        return stil_test
+
+
+    @staticmethod
+    def _parse_stil_file_parallel(file_path: str, raw_file: BinaryIO, process_count: int) -> StilTest:
+        stil_test: StilTest = StilTest()
+        with mmap(raw_file.fileno(), 0, access=ACCESS_READ) as stil_buffer:
+            stil_test = StilParser._parse_stil_header_buffer(stil_test=stil_test, stil_buffer=stil_buffer)
+            chunk_list: List[Tuple[int, int, int]] = StilParser._split_test_vector_buffer(
+                stil_buffer=stil_buffer,
+                start=stil_buffer.tell(),
+                end=len(stil_buffer),
+                chunk_count=process_count*StilParser.CHUNK_PER_PROCESS
+            )
+
+        # the workers hand back sorted test vectors, only the tester cycles split across two chunks are sorted again here
+        merged_tester_cycle_set: Set[int] = set()
+        with ProcessPoolExecutor(
+            max_workers=process_count,
+            initializer=StilParser._init_chunk_worker,
+            initargs=(file_path, stil_test)
+        ) as executor:
+            # map() yields in submission order, so the chunks are merged in file order
+            for test_vector_dict_bytes in executor.map(StilParser._parse_test_vector_chunk, chunk_list):
+                merged_tester_cycle_set.update(StilParser._load_test_vector_chunk(stil_test=stil_test, test_vector_dict_bytes=test_vector_dict_bytes))
+
+        for tester_cycle in merged_tester_cycle_set:
+            stil_test.test_vector_dict[tester_cycle].sort()
+        stil_test.sort(sort_test_vectors=False)
+        return stil_test
+
+
+    @staticmethod
+    def _load_test_vector_chunk(stil_test: StilTest, test_vector_dict_bytes: bytes) -> Set[int]:
+        test_vector_dict: Dict[int, StilTestVector] = _StilTestVectorUnpickler(
+            file=BytesIO(test_vector_dict_bytes),
+            stil_test=stil_test
+        ).load()
+        return stil_test.merge_test_vector_dict(test_vector_dict=test_vector_dict)
+
+
+    @staticmethod
+    def _split_test_vector_buffer(stil_buffer: mmap, start: int, end: int, chunk_count: int) -> List[Tuple[int, int, int]]:
+        boundary_list: List[int] = [start]
+        for chunk_idx in range(1, chunk_count):
+            search_start: int = stil_buffer.find(b"\n", max(start + (end - start)*chunk_idx//chunk_count, boundary_list[-1]), end) + 1
+            if search_start == 0:
+                break
+            block_match: Optional[Match[bytes]] = StilParser.VECTOR_BLOCK_REGEX.search(stil_buffer, search_start, end)
+            if block_match is None:
+                break
+            if block_match.start() > boundary_list[-1]:
+                boundary_list.append(block_match.start())
+        boundary_list.append(end)
+
+        # each chunk starts on a V block, so it inherits the tester cycle of the last annotation before it,
+        # which is searched for in the previous chunk only and carried forward otherwise
+        chunk_list: List[Tuple[int, int, int]] = []
+        tester_cycle: int = 0
+        for previous_start, chunk_start, chunk_end in zip([start] + boundary_list[:-2], boundary_list[:-1], boundary_list[1:]):
+            tester_cycle_idx: int = stil_buffer.rfind(b"TesterCycle:", previous_start, chunk_start)
+            if tester_cycle_idx != -1:
+                tester_cycle_match: Optional[Match[bytes]] = StilParser.TESTER_CYCLE_REGEX.match(stil_buffer, tester_cycle_idx, chunk_start)
+                if tester_cycle_match is None:
+                    raise ValueError(f"Could not extract tester cycle at byte '{tester_cycle_idx}'")
+                tester_cycle = int(tester_cycle_match.group(1))
+            chunk_list.append((chunk_start, chunk_end, tester_cycle))
+
+        return chunk_list
+
+
+    @staticmethod
+    def _init_chunk_worker(file_path: str, stil_test: StilTest) -> None:
+        StilParser._chunk_worker_file_path = file_path
+        StilParser._chunk_worker_stil_test = stil_test
+
+
+    @staticmethod
+    def _parse_test_vector_chunk(chunk: Tuple[int, int, int]) -> bytes:
+        if StilParser._chunk_worker_stil_test is None or StilParser._chunk_worker_file_path is None:
+            raise AttributeError("Chunk worker is not initialized")
+        chunk_start, chunk_end, tester_cycle = chunk
+        stil_test: StilTest = StilParser._chunk_worker_stil_test
+        stil_test.clear_test_vector_dict()
+
+        with open(StilParser._chunk_worker_file_path, "rb") as raw_file, mmap(raw_file.fileno(), 0, access=ACCESS_READ) as stil_buffer:
+            stil_test, _ = StilParser._parse_test_vector_buffer(
+                stil_test=stil_test,
+                stil_buffer=stil_buffer,
+                start=chunk_start,
+                end=chunk_end,
+                tester_cycle=tester_cycle
+            )
+        stil_test.sort()
+
+        # the parent rebuilds whatever is pickled, equal events are shared so each one is sent once and loaded as a memo reference
+        event_dict: Dict[Tuple[StilSignal, Any], Tuple[StilSignal, Any]] = {}
+        for test_vector in stil_test.test_vector_dict.values():
+            for signal_value_tuple_list in test_vector.test_vector.values():
+                signal_value_tuple_list[:] = [event_dict.setdefault(event, event) for event in signal_value_tuple_list]
+
+        test_vector_dict_bytes: BytesIO = BytesIO()
+        _StilTestVectorPickler(test_vector_dict_bytes, protocol=HIGHEST_PROTOCOL).dump(stil_test.test_vector_dict)
+        return test_vector_dict_bytes.getvalue()
+
+
+    @staticmethod
+    def _parse_test_name(stil_test: StilTest, line_iter: Iterator[Tuple[int, str]]) -> StilTest:
+        line_idx, line = StilParser._skip_to_line(line_iter=line_iter, token="Title ")
+
+        test_name: Optional[Match[str]] = search(r'"(.*?)"', line)
         if test_name is None:
-            raise ValueError(f"Could not find the test name in string '{line_list[line_idx]}' at line '{line_idx}'")        
+            raise ValueError(f"Could not find the test name in string '{line}' at line '{line_idx}'")        
         stil_test.set_name(name=test_name.group(0).strip("\""))
 
-        return stil_test, line_idx
+        return stil_test
 
 
     @staticmethod
-    def _parse_signals(stil_test: StilTest, line_list: List[str], line_idx: int) -> Tuple[StilTest, int]:
-        while "Signals {" not in line_list[line_idx]:
-            line_idx+=1
+    def _parse_signals(stil_test: StilTest, line_iter: Iterator[Tuple[int, str]]) -> StilTest:
+        StilParser._skip_to_line(line_iter=line_iter, token="Signals {")
 
-        line_idx+=1
-        while line_list[line_idx].strip() != "}":
-            signal_list: List[str] = StilParser._clean_str_list(list_str=line_list[line_idx].strip().split(";"))
+        line_idx, line = StilParser._next_line(line_iter=line_iter)
+        while line.strip() != "}":
+            signal_list: List[str] = StilParser._clean_str_list(list_str=line.strip().split(";"))
             for signal in signal_list:
                 signal_name: Optional[Match[str]] = search(r"\"(.*?)\"", signal)
                 if signal_name is None:
@@ -74,54 +449,48 @@ class StilParser():
                 if signal_type is None:
                     raise ValueError(f"Signal type {signal_type} is not 'In' or 'Out'") 
                 stil_test.add_signal(signal_name=signal_name.group(0).strip("\""), signal_type=signal_type.group(0))
-            line_idx+=1
+            line_idx, line = StilParser._next_line(line_iter=line_iter)
 
-        return stil_test, line_idx
+        return stil_test
 
 
     @staticmethod
-    def _parse_signal_groups(stil_test: StilTest, line_list: List[str], line_idx: int) -> Tuple[StilTest, int]:
-        while "SignalGroups {" not in line_list[line_idx]:
-                line_idx+=1
+    def _parse_signal_groups(stil_test: StilTest, line_iter: Iterator[Tuple[int, str]]) -> StilTest:
+        StilParser._skip_to_line(line_iter=line_iter, token="SignalGroups {")
 
-        line_idx+=1
-        while line_list[line_idx].strip() != "}":
-            signal_group_name: str = line_list[line_idx].strip().split("=")[0].strip()
-            signal_list: List[str] = findall(r"\"(.*?)\"", line_list[line_idx])
+        line_idx, line = StilParser._next_line(line_iter=line_iter)
+        while line.strip() != "}":
+            signal_group_name: str = line.strip().split("=")[0].strip()
+            signal_list: List[str] = findall(r"\"(.*?)\"", line)
             if signal_list == []:
                 raise ValueError(f"No signal found in 'signal_list'={signal_list} with 'signal_group_name'={signal_group_name}")
             stil_test.add_signal_group(signal_group_name=signal_group_name, signal_list=signal_list)
-            line_idx+=1
+            line_idx, line = StilParser._next_line(line_iter=line_iter)
 
-        return stil_test, line_idx
+        return stil_test
 
 
     @staticmethod
-    def _parse_waveform_table(stil_test: StilTest, line_list: List[str], line_idx: int) -> Tuple[StilTest, int]:
-        while "Timing RETARGET_timing {" not in line_list[line_idx]:
-            line_idx+=1
+    def _parse_waveform_table(stil_test: StilTest, line_iter: Iterator[Tuple[int, str]]) -> StilTest:
+        StilParser._skip_to_line(line_iter=line_iter, token="Timing RETARGET_timing {")
+        line_idx, line = StilParser._skip_to_line(line_iter=line_iter, token="Period ")
 
-        line_idx+=1
-        while "Period " not in line_list[line_idx]:
-            line_idx+=1
-
-        full_str = line_list[line_idx].strip().removeprefix("Period").removesuffix(";").strip().strip("'")
+        full_str = line.strip().removeprefix("Period").removesuffix(";").strip().strip("'")
         period_str: Optional[Match[str]] = search(r"\d+", full_str)
         units_str: Optional[Match[str]] = search(r"(?:ms|us|ns|ps|fs)", full_str)
         if period_str is None or units_str is None:
-            raise ValueError(f"Could not extract period and/or units from line '{line_list[line_idx]}' at line: '{line_idx}'")
+            raise ValueError(f"Could not extract period and/or units from line '{line}' at line: '{line_idx}'")
         stil_test.set_waveform_table(period=int(period_str.group(0)), units=units_str.group(0))
         
-        return stil_test, line_idx
+        return stil_test
     
     @staticmethod
-    def _parse_waveforms(stil_test: StilTest, line_list: List[str], line_idx: int) -> Tuple[StilTest, int]:
-        while "Waveforms  {" not in line_list[line_idx]:
-            line_idx+=1
+    def _parse_waveforms(stil_test: StilTest, line_iter: Iterator[Tuple[int, str]]) -> StilTest:
+        StilParser._skip_to_line(line_iter=line_iter, token="Waveforms  {")
 
-        line_idx+=1
-        while line_list[line_idx].strip() != "}":
-            current_line: List[str] = StilParser._clean_str_list(line_list[line_idx].strip().split("{"))
+        line_idx, line = StilParser._next_line(line_iter=line_iter)
+        while line.strip() != "}":
+            current_line: List[str] = StilParser._clean_str_list(line.strip().split("{"))
             if len(current_line) != 3:
                 raise ValueError(f"Could not extract waveform from line '{current_line}'")
             signal_group_name: str = current_line[0]
@@ -130,12 +499,12 @@ class StilParser():
             for timestamp in timestamp_list:
                 timestamp_key_str: Optional[Match[str]] = search(r"'(.*?)'", timestamp)
                 if timestamp_key_str is None:
-                    raise ValueError(f"Could not extract timmestamp key in line '{line_list[line_idx].strip()}' at line: '{line_idx}'")
+                    raise ValueError(f"Could not extract timmestamp key in line '{line.strip()}' at line: '{line_idx}'")
                 clean_timestamp_key_str: str = timestamp_key_str.group(0).removeprefix("'").removesuffix(f"{stil_test.waveform_table.units.value}'")
                 timestamp_key: int = int(clean_timestamp_key_str)
                 timestamp_val: Optional[Match[str]] = search(r"[DUN|LHXT](?:/[DUN|LHXT])*", timestamp)
                 if timestamp_val is None:
-                    raise ValueError(f"Could not extract timestamp value in line '{line_list[line_idx].strip()}' at line: '{line_idx}'")
+                    raise ValueError(f"Could not extract timestamp value in line '{line.strip()}' at line: '{line_idx}'")
                 
                 stil_test.add_waveform(
                     signal_group_name=signal_group_name,
@@ -143,36 +512,122 @@ class StilParser():
                     timestamp_key=timestamp_key,
                     timestamp_val_list=StilParser._clean_str_list(timestamp_val.group(0).split('/'))
                 )
-            line_idx+=1
+            line_idx, line = StilParser._next_line(line_iter=line_iter)
 
-        return stil_test, line_idx
+        return stil_test
 
 
     @staticmethod
-    def _parse_test_vector(stil_test: StilTest, line_list: List[str], line_idx: int) -> Tuple[StilTest, int]:
+    def _parse_test_vector(stil_test: StilTest, line_iter: Iterator[Tuple[int, str]]) -> StilTest:
         tester_cycle: int = 0
         
-        while line_idx < len(line_list)-1:
-            if "TesterCycle:" in line_list[line_idx].strip():
-                tester_cycle_match: Optional[Match[str]] = search(r"TesterCycle:(\d)+", line_list[line_idx].strip())
-                if tester_cycle_match is None:
-                    raise ValueError(f"Could not extract tester cycle in line '{line_list[line_idx].strip()}' at line '{line_idx}'")
-                tester_cycle = int(tester_cycle_match.group(0).removeprefix("TesterCycle:"))
-            if line_list[line_idx].strip() == "V {":
-                line_idx+=1
-                while line_list[line_idx].strip() != "}":
-                    signal_group_name: str = line_list[line_idx].strip().split("=")[0].strip()
-                    signal_value_str: str = line_list[line_idx].strip().split("=")[1].strip().removesuffix(";")
-                    if signal_group_name == "":
-                        raise ValueError(f"Could not extract signal group name from test vector line '{line_list[line_idx]}' at line '{line_idx}'")
-                    if signal_value_str == "":
-                        raise ValueError(f"Could not extract signal value from test vector line '{line_list[line_idx]}' at line '{line_idx}'")
-                    stil_test.add_test_vector(tester_cycle=tester_cycle, signal_group_name=signal_group_name, value_str=signal_value_str)
-                    line_idx+=1
-            line_idx+=1
+        for line_idx, line in line_iter:
+            if "TesterCycle:" in line:
+                tester_cycle = StilParser._parse_tester_cycle(line_idx=line_idx, line=line)
+            if line.strip() == "V {":
+                stil_test = StilParser._parse_test_vector_lines(stil_test=stil_test, line_iter=line_iter, tester_cycle=tester_cycle)
 
         stil_test.sort()
-        return stil_test, line_idx
+        return stil_test
+
+
+    @staticmethod
+    def _iter_test_vector(stil_test: StilTest, line_iter: Iterator[Tuple[int, str]]) -> Iterator[StilTestVector]:
+        # a tester cycle is complete when the next TesterCycle annotation changes it, so it can be handed out right away
+        tester_cycle: int = 0
+        last_tester_cycle: Optional[int] = None
+
+        for line_idx, line in line_iter:
+            if "TesterCycle:" in line:
+                next_tester_cycle: int = StilParser._parse_tester_cycle(line_idx=line_idx, line=line)
+                if next_tester_cycle != tester_cycle and tester_cycle in stil_test.test_vector_dict:
+                    last_tester_cycle = tester_cycle
+                    yield StilParser._pop_sorted_test_vector(stil_test=stil_test, tester_cycle=tester_cycle)
+                tester_cycle = next_tester_cycle
+            if line.strip() == "V {":
+                if last_tester_cycle is not None and tester_cycle <= last_tester_cycle:
+                    raise ValueError(f"Tester cycle '{tester_cycle}' at line '{line_idx}' comes after tester cycle '{last_tester_cycle}', test vectors cannot be handed out in cycle order")
+                stil_test = StilParser._parse_test_vector_lines(stil_test=stil_test, line_iter=line_iter, tester_cycle=tester_cycle)
+
+        for tester_cycle in sorted(stil_test.test_vector_dict.keys()):
+            yield StilParser._pop_sorted_test_vector(stil_test=stil_test, tester_cycle=tester_cycle)
+
+
+    @staticmethod
+    def _pop_sorted_test_vector(stil_test: StilTest, tester_cycle: int) -> StilTestVector:
+        test_vector: StilTestVector = stil_test.pop_test_vector(tester_cycle=tester_cycle)
+        test_vector.sort()
+        return test_vector
+
+
+    @staticmethod
+    def _parse_tester_cycle(line_idx: int, line: str) -> int:
+        tester_cycle_match: Optional[Match[str]] = search(r"TesterCycle:(\d)+", line.strip())
+        if tester_cycle_match is None:
+            raise ValueError(f"Could not extract tester cycle in line '{line.strip()}' at line '{line_idx}'")
+        return int(tester_cycle_match.group(0).removeprefix("TesterCycle:"))
+
+
+    @staticmethod
+    def _parse_test_vector_lines(stil_test: StilTest, line_iter: Iterator[Tuple[int, str]], tester_cycle: int) -> StilTest:
+        line_idx, line = StilParser._next_line(line_iter=line_iter)
+        while line.strip() != "}":
+            signal_group_name: str = line.strip().split("=")[0].strip()
+            signal_value_str: str = line.strip().split("=")[1].strip().removesuffix(";")
+            if signal_group_name == "":
+                raise ValueError(f"Could not extract signal group name from test vector line '{line}' at line '{line_idx}'")
+            if signal_value_str == "":
+                raise ValueError(f"Could not extract signal value from test vector line '{line}' at line '{line_idx}'")
+            stil_test.add_test_vector(tester_cycle=tester_cycle, signal_group_name=signal_group_name, value_str=signal_value_str)
+            line_idx, line = StilParser._next_line(line_iter=line_iter)
+
+        return stil_test
+
+
+    @staticmethod
+    def _parse_test_vector_buffer(stil_test: StilTest, stil_buffer: mmap, start: int, end: int, tester_cycle: int) -> Tuple[StilTest, int]:
+        # every line of the range gives exactly one token, blank lines are skipped,
+        # the range is scanned in windows ending on a newline to bound the size of the token lists
+        in_block: bool = False
+        pos: int = start - 1 if start > 0 and stil_buffer[start-1:start] == b"\n" else start
+        while pos < end:
+            window_end: int = stil_buffer.find(b"\n", min(pos + StilParser.PATTERN_WINDOW_SIZE, end), end)
+            if window_end == -1:
+                window_end = end
+            for block_token, signal_group_name, signal_value_str, tester_cycle_str, other_line in StilParser.PATTERN_TOKEN_REGEX.findall(stil_buffer, pos, window_end):
+                if in_block:
+                    if signal_group_name:
+                        stil_test.add_test_vector(tester_cycle=tester_cycle, signal_group_name=signal_group_name.decode(), value_str=signal_value_str.decode())
+                    elif block_token == b"}":
+                        in_block = False
+                    elif block_token or tester_cycle_str or other_line.strip():
+                        line: bytes = b"TesterCycle:" + tester_cycle_str if tester_cycle_str else block_token or other_line
+                        raise ValueError(f"Could not extract signal group name and value from test vector line '{line.decode().strip()}' at tester cycle '{tester_cycle}'")
+                elif tester_cycle_str:
+                    tester_cycle = int(tester_cycle_str)
+                elif block_token == b"V {":
+                    in_block = True
+            pos = window_end
+
+        if in_block:
+            raise ValueError(f"Reached byte '{end}' before the end of the test vector block at tester cycle '{tester_cycle}'")
+        return stil_test, tester_cycle
+
+
+    @staticmethod
+    def _next_line(line_iter: Iterator[Tuple[int, str]]) -> Tuple[int, str]:
+        try:
+            return next(line_iter)
+        except StopIteration:
+            raise ValueError("Reached the end of the stil file before the end of the current block")
+
+
+    @staticmethod
+    def _skip_to_line(line_iter: Iterator[Tuple[int, str]], token: str) -> Tuple[int, str]:
+        for line_idx, line in line_iter:
+            if token in line:
+                return line_idx, line
+        raise ValueError(f"Reached the end of the stil file before finding '{token}'")
 
 
     @staticmethod
@@ -1,5 +1,5 @@
 # standard packages
-from typing import Optional, List
+from typing import Optional, List, Dict, Sequence
 
 
 #local packages
@@ -10,7 +10,11 @@ class StilSignalGroup():
     def __init__(self, name: str, signal_type: Optional[StilSignalType]=None) -> None:
         self._name: str = name
         self._signal_list: List[StilSignal] = []
+        # position of each signal in the group, which is also its offset in the value strings of the group
+        self._signal_position_dict: Dict[StilSignal, int] = {}
+        self._signal_name_position_dict: Dict[str, int] = {}
         self._signal_type: Optional[StilSignalType] = signal_type
+        self._read_only: bool = False
 
 
     @property
@@ -26,50 +30,103 @@ class StilSignalGroup():
 
 
     @property
-    def signal_list(self) -> List[StilSignal]:
+    def signal_list(self) -> Sequence[StilSignal]:
         return self._signal_list
-    
-    
+
+
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+
+    def set_read_only(self) -> None:
+        # the signal list is replaced by a tuple so it cannot be appended to through the property
+        self._signal_list = tuple(self._signal_list)
+        self._read_only = True
+
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise AttributeError(f"Signal group '{self.name}' is read-only")
+
+
     def add_signal_from_list(self, signal_list: List[StilSignal]) -> None:
         for signal in signal_list:
             self.add_signal(signal)
 
 
     def add_signal(self, signal: StilSignal) -> None:
-        if signal in self.signal_list:
+        self._check_writable()
+        if signal in self._signal_position_dict:
             raise ValueError(f"Signal '{signal.name}' already in group '{[signal.name for signal in self.signal_list]}'")
         if self._signal_type is None:
             self._signal_type = signal.signal_type
         if signal.signal_type != self.signal_type:
             raise ValueError(f"Cannot add signals of conflicting type '{self.signal_type}' to signal group associated with signal type '{self.signal_type}'")
-        self.signal_list.append(signal)
+        self._signal_position_dict[signal] = len(self._signal_list)
+        self._signal_name_position_dict[signal.name] = len(self._signal_list)
+        self._signal_list.append(signal)
 
 
     def get_signal_from_name(self, signal_name: str) -> StilSignal:
-        for signal in self.signal_list:
-            if signal.name == signal_name:
-                return signal
-        raise ValueError(f"Signal with name '{signal_name}' not in signal group '{[signal.name for signal in self.signal_list]}'")
+        return self.signal_list[self.get_signal_position_from_name(signal_name=signal_name)]
+
+
+    def get_signal_from_position(self, signal_position: int) -> StilSignal:
+        if not 0 <= signal_position < len(self.signal_list):
+            raise ValueError(f"Signal position '{signal_position}' out of range for signal group '{self.name}' of width '{len(self.signal_list)}'")
+        return self.signal_list[signal_position]
+
+
+    def get_signal_position(self, signal: StilSignal) -> int:
+        signal_position: Optional[int] = self._signal_position_dict.get(signal)
+        if signal_position is None:
+            raise ValueError(f"Signal '{signal.name}' not in signal group '{self.name}'")
+        return signal_position
+
+
+    def get_signal_position_from_name(self, signal_name: str) -> int:
+        signal_position: Optional[int] = self._signal_name_position_dict.get(signal_name)
+        if signal_position is None:
+            raise ValueError(f"Signal with name '{signal_name}' not in signal group '{[signal.name for signal in self.signal_list]}'")
+        return signal_position
+
+
+    def has_signal(self, signal: StilSignal) -> bool:
+        return signal in self._signal_position_dict
 
 
     def is_in_group(self, signal_name: str) -> bool:
-        return signal_name in [signal.name for signal in self.signal_list]
+        return signal_name in self._signal_name_position_dict
 
 
     def remove_signal(self, signal: StilSignal) -> None:
-        if signal in self.signal_list:
-            self._signal_list.remove(signal)
+        self._check_writable()
+        if signal in self._signal_position_dict:
+            self._remove_signal_at_position(signal_position=self._signal_position_dict[signal])
       
 
     def remove_signal_from_name(self, signal_name: str) -> None:
-        for signal in self.signal_list:
-            if signal.name == signal_name:
-                self._signal_list.remove(signal)
+        self._check_writable()
+        if signal_name in self._signal_name_position_dict:
+            self._remove_signal_at_position(signal_position=self._signal_name_position_dict[signal_name])
 
 
     def empty(self) -> None:
-        for signal in self.signal_list:
-            self._signal_list.remove(signal)
+        self._check_writable()
+        self._signal_list.clear()
+        self._signal_position_dict.clear()
+        self._signal_name_position_dict.clear()
+
+
+    def _remove_signal_at_position(self, signal_position: int) -> None:
+        # the signals after the removed one move down by one position
+        removed_signal: StilSignal = self._signal_list.pop(signal_position)
+        del self._signal_position_dict[removed_signal]
+        del self._signal_name_position_dict[removed_signal.name]
+        for i in range(signal_position, len(self._signal_list)):
+            self._signal_position_dict[self._signal_list[i]] = i
+            self._signal_name_position_dict[self._signal_list[i].name] = i
 
 
     def get_signal_group_str(self, indent_level: int=0) -> str:
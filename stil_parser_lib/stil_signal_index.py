@@ -0,0 +1,138 @@
+# standard packages
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import ne
+from typing import Dict, List, Tuple, Union, Optional, Mapping
+
+
+# local packages
+from stil_signal import StilSignal
+from stil_waveform import StilForce, StilCompare
+from stil_test_vector import StilTestVector
+
+
+class StilSignalIndex():
+    # every value of StilForce and StilCompare is a distinct character, so each event is stored as one character
+    VALUE_DICT: Dict[str, Union[StilForce, StilCompare]] = {
+        **{value.value: value for value in StilForce},
+        **{value.value: value for value in StilCompare}
+    }
+    LEVEL_STR: str = "UDHL"
+    NON_LEVEL_TABLE: Dict[int, None] = str.maketrans("", "", "NXT")
+
+
+    def __init__(self, period: int, test_vector_dict: Mapping[int, StilTestVector]) -> None:
+        self._period: int = period
+        self._tester_cycle_array_dict: Dict[str, array] = {}
+        self._time_array_dict: Dict[str, array] = {}
+        self._value_str_dict: Dict[str, str] = {}
+
+        # events are gathered in lists keyed by signal object, which is cheaper per event than arrays keyed by name,
+        # enum members are not hashed since Enum.__hash__ is implemented in Python, their _value_ is the code
+        event_dict: Dict[StilSignal, Tuple[List[int], List[int], List[str]]] = {}
+        for tester_cycle, test_vector in sorted(test_vector_dict.items()):
+            cycle_time: int = tester_cycle*period
+            for timestamp, signal_value_tuple_list in sorted(test_vector.test_vector.items()):
+                time: int = cycle_time + timestamp
+                for (signal, value) in signal_value_tuple_list:
+                    event: Optional[Tuple[List[int], List[int], List[str]]] = event_dict.get(signal)
+                    if event is None:
+                        event = ([], [], [])
+                        event_dict[signal] = event
+                    event[0].append(tester_cycle)
+                    event[1].append(time)
+                    event[2].append(value._value_)
+
+        for signal, (tester_cycle_list, time_list, code_list) in event_dict.items():
+            self._tester_cycle_array_dict[signal.name] = array("q", tester_cycle_list)
+            self._time_array_dict[signal.name] = array("q", time_list)
+            self._value_str_dict[signal.name] = "".join(code_list)
+
+
+    @property
+    def period(self) -> int:
+        return self._period
+
+
+    @property
+    def tester_cycle_array_dict(self) -> Dict[str, array]:
+        return self._tester_cycle_array_dict
+
+
+    @property
+    def time_array_dict(self) -> Dict[str, array]:
+        return self._time_array_dict
+
+
+    @property
+    def value_str_dict(self) -> Dict[str, str]:
+        return self._value_str_dict
+
+
+    def get_cycle_event_list(self, signal_name: str, tester_cycle: int) -> List[Tuple[int, Union[StilForce, StilCompare]]]:
+        tester_cycle_array: array = self._get_array(array_dict=self.tester_cycle_array_dict, signal_name=signal_name)
+        start_idx: int = bisect_left(tester_cycle_array, tester_cycle)
+        end_idx: int = bisect_right(tester_cycle_array, tester_cycle, start_idx)
+        cycle_time: int = tester_cycle*self.period
+        return self._get_event_list(signal_name=signal_name, start_idx=start_idx, end_idx=end_idx, time_offset=cycle_time)
+
+
+    def get_event_list(self, signal_name: str, start_time: int, end_time: int) -> List[Tuple[int, Union[StilForce, StilCompare]]]:
+        time_array: array = self._get_array(array_dict=self.time_array_dict, signal_name=signal_name)
+        start_idx: int = bisect_left(time_array, start_time)
+        end_idx: int = bisect_left(time_array, end_time, start_idx)
+        return self._get_event_list(signal_name=signal_name, start_idx=start_idx, end_idx=end_idx, time_offset=0)
+
+
+    def get_value_at_time(self, signal_name: str, time: int) -> Optional[Union[StilForce, StilCompare]]:
+        event_idx: int = bisect_right(self._get_array(array_dict=self.time_array_dict, signal_name=signal_name), time)
+        if event_idx == 0:
+            return None
+        return StilSignalIndex.VALUE_DICT[self.value_str_dict[signal_name][event_idx-1]]
+
+
+    def get_edge_list(self, signal_name: str) -> List[Tuple[int, Union[StilForce, StilCompare]]]:
+        # an edge is a change between driven or compared levels, none, don't care and high impedance events are skipped
+        time_array: array = self._get_array(array_dict=self.time_array_dict, signal_name=signal_name)
+        edge_list: List[Tuple[int, Union[StilForce, StilCompare]]] = []
+        previous_code: str = ""
+        for i, code in enumerate(self.value_str_dict[signal_name]):
+            if code not in StilSignalIndex.LEVEL_STR:
+                continue
+            if previous_code != "" and code != previous_code:
+                edge_list.append((time_array[i], StilSignalIndex.VALUE_DICT[code]))
+            previous_code = code
+        return edge_list
+
+
+    def get_toggle_count(self, signal_name: str) -> int:
+        self._get_array(array_dict=self.time_array_dict, signal_name=signal_name)
+        level_str: str = self.value_str_dict[signal_name].translate(StilSignalIndex.NON_LEVEL_TABLE)
+        return sum(map(ne, level_str, level_str[1:]))
+
+
+    def _get_array(self, array_dict: Dict[str, array], signal_name: str) -> array:
+        signal_array: Optional[array] = array_dict.get(signal_name)
+        if signal_array is None:
+            raise ValueError(f"Signal '{signal_name}' has no event in '{list(array_dict.keys())}'")
+        return signal_array
+
+
+    def _get_event_list(self, signal_name: str, start_idx: int, end_idx: int, time_offset: int) -> List[Tuple[int, Union[StilForce, StilCompare]]]:
+        time_array: array = self.time_array_dict[signal_name]
+        value_str: str = self.value_str_dict[signal_name]
+        return [(time_array[i] - time_offset, StilSignalIndex.VALUE_DICT[value_str[i]]) for i in range(start_idx, end_idx)]
+
+
+    def get_signal_index_str(self, indent_level: int=0) -> str:
+        indent_str="\t" * indent_level
+        signal_index_str: str = ""
+        signal_index_str+=f"{indent_str}{type(self).__qualname__}:\n"
+        signal_index_str+=f"{indent_str}\tperiod: '{self.period}'\n"
+
+        signal_index_str+=f"{indent_str}\tsignal list: \n"
+        for signal_name, time_array in self.time_array_dict.items():
+            signal_index_str+=f"{indent_str}\t\tsignal: '{signal_name}' events: '{len(time_array)}'\n"
+
+        signal_index_str=signal_index_str.removesuffix("\n")
+        return signal_index_str
@@ -1,5 +1,6 @@
 # standard packages
-from typing import Optional, Dict, List, Union
+from types import MappingProxyType
+from typing import Optional, Dict, List, Union, Mapping, Set
 
 
 # local packages
@@ -8,6 +9,7 @@ from stil_signal_group import StilSignalGroup
 from stil_waveform import StilTimingInCondition, StilTimingOutCondition, StilForce, StilCompare, StilUnits, StilWaveform
 from stil_waveform_table import StilWaveformTable
 from stil_test_vector import StilTestVector
+from stil_signal_index import StilSignalIndex
 
 
 class StilTest():
@@ -17,6 +19,8 @@ class StilTest():
         self._signal_group_dict: Dict[str, StilSignalGroup] = {}
         self._waveform_table: Optional[StilWaveformTable] = None
         self._test_vector_dict: Dict[int, StilTestVector] = {}
+        self._signal_index: Optional[StilSignalIndex] = None
+        self._read_only: bool = False
  
 
     @property
@@ -27,12 +31,16 @@ class StilTest():
 
 
     @property
-    def signal_dict(self) -> Dict[str, StilSignal]:
+    def signal_dict(self) -> Mapping[str, StilSignal]:
+        if self.read_only:
+            return MappingProxyType(self._signal_dict)
         return self._signal_dict
 
 
     @property
-    def signal_group_dict(self) -> Dict[str, StilSignalGroup]:
+    def signal_group_dict(self) -> Mapping[str, StilSignalGroup]:
+        if self.read_only:
+            return MappingProxyType(self._signal_group_dict)
         return self._signal_group_dict
 
 
@@ -44,33 +52,79 @@ class StilTest():
 
 
     @property
-    def test_vector_dict(self) -> Dict[int, StilTestVector]:
+    def test_vector_dict(self) -> Mapping[int, StilTestVector]:
+        if self.read_only:
+            return MappingProxyType(self._test_vector_dict)
         return self._test_vector_dict
 
 
+    @property
+    def signal_index(self) -> StilSignalIndex:
+        # built on first use, any change to the test vectors made through the test drops it,
+        # events added directly through StilTestVector.add_input_event/add_output_event need clear_signal_index()
+        if self._signal_index is None:
+            self._signal_index = StilSignalIndex(period=self.waveform_table.period, test_vector_dict=self.test_vector_dict)
+        return self._signal_index
+
+
+    @property
+    def has_signal_index(self) -> bool:
+        return self._signal_index is not None
+
+
+    def clear_signal_index(self) -> None:
+        self._check_writable()
+        self._signal_index = None
+
+
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+
+    def set_read_only(self) -> None:
+        # signal groups and the waveform table are reachable from the test, they are frozen with it
+        for signal_group in self._signal_group_dict.values():
+            signal_group.set_read_only()
+        if self._waveform_table is not None:
+            self._waveform_table.set_read_only()
+        for test_vector in self._test_vector_dict.values():
+            test_vector.set_read_only()
+        self._read_only = True
+
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise AttributeError(f"Stil test '{self._name}' is read-only")
+
+
     def set_name(self, name: str) -> None:
+        self._check_writable()
         if self._name is not None:
             raise AttributeError(f"Stil test already has a name: '{self.name}'")
         self._name = name
 
 
     def add_signal(self, signal_name: str, signal_type: str) -> None:
+        self._check_writable()
         if signal_name in self.signal_dict:
             raise AttributeError(f"Signal '{signal_name}' already in '{list(self.signal_dict.keys())}'")
         stil_signal_type: StilSignalType = StilSignalType(signal_type)
-        self.signal_dict[signal_name] = StilSignal(name=signal_name, signal_type=stil_signal_type)
+        self._signal_dict[signal_name] = StilSignal(name=signal_name, signal_type=stil_signal_type)
 
 
     def add_signal_group(self, signal_group_name: str, signal_list: List[str]) -> None:
+        self._check_writable()
         if signal_group_name in self.signal_group_dict:
             raise AttributeError(f"Signal group '{signal_group_name}' already in '{list(self.signal_group_dict.keys())}'")
 
         self._signal_group_dict[signal_group_name] = StilSignalGroup(name=signal_group_name)
         for signal_name in signal_list:
-            self.signal_group_dict[signal_group_name].add_signal(signal=self.signal_dict[signal_name])
+            self._signal_group_dict[signal_group_name].add_signal(signal=self.signal_dict[signal_name])
 
 
     def set_waveform_table(self, period: int, units: str) -> None:
+        self._check_writable()
         if self._waveform_table is not None:
             raise AttributeError(f"Waveform table is already defined '{self.waveform_table.get_waveform_table_str}'")
         stil_units: StilUnits = StilUnits(units)
@@ -78,6 +132,7 @@ class StilTest():
 
 
     def add_waveform(self, signal_group_name: str, timing_condition: str, timestamp_key: int, timestamp_val_list: List[str]) -> None:
+        self._check_writable()
         if self.signal_group_dict[signal_group_name].signal_type == StilSignalType.INPUT:
             self._add_input_waveform(
                 signal_group_name=signal_group_name,
@@ -140,6 +195,8 @@ class StilTest():
 
 
     def add_test_vector(self, tester_cycle: int, signal_group_name: str, value_str: str) -> None:
+        self._check_writable()
+        self._signal_index = None
         if self.signal_group_dict[signal_group_name].signal_type == StilSignalType.INPUT:
             self._add_input_test_vector(tester_cycle=tester_cycle, signal_group_name=signal_group_name, value_str=value_str)
         elif self.signal_group_dict[signal_group_name].signal_type == StilSignalType.OUTPUT:
@@ -155,7 +212,7 @@ class StilTest():
         
         stil_test_vector: Optional[StilTestVector] = self.test_vector_dict.get(tester_cycle)
         if stil_test_vector is None:
-            self.test_vector_dict[tester_cycle] = StilTestVector(
+            self._test_vector_dict[tester_cycle] = StilTestVector(
                 tester_cycle=tester_cycle,
                 waveform_table=self.waveform_table   
             )
@@ -176,16 +233,50 @@ class StilTest():
                 tester_cycle=tester_cycle,
                 waveform_table=self.waveform_table   
             )
+            self._test_vector_dict[tester_cycle] = stil_test_vector
         stil_test_vector.add_output_event(
             signal_group=self.signal_group_dict[signal_group_name],
             value_list=stil_value_list
         )
 
 
-    def sort(self) -> None:
+    def pop_test_vector(self, tester_cycle: int) -> StilTestVector:
+        self._check_writable()
+        if tester_cycle not in self.test_vector_dict:
+            raise ValueError(f"Tester cycle '{tester_cycle}' not in test '{self.name}'")
+        self._signal_index = None
+        return self._test_vector_dict.pop(tester_cycle)
+
+
+    def clear_test_vector_dict(self) -> None:
+        self._check_writable()
+        self._signal_index = None
+        self._test_vector_dict.clear()
+
+
+    def merge_test_vector_dict(self, test_vector_dict: Mapping[int, StilTestVector]) -> Set[int]:
+        # returns the tester cycles present on both sides, their events are appended to the existing test vectors
+        self._check_writable()
+        self._signal_index = None
+        if {test_vector.waveform_table for test_vector in test_vector_dict.values()} - {self.waveform_table}:
+            raise ValueError(f"Test vectors do not share the waveform table of test '{self.name}'")
+
+        merged_tester_cycle_set: Set[int] = self._test_vector_dict.keys() & test_vector_dict.keys()
+        merged_test_vector_dict: Dict[int, StilTestVector] = {}
+        for tester_cycle in merged_tester_cycle_set:
+            merged_test_vector_dict[tester_cycle] = self._test_vector_dict[tester_cycle]
+            merged_test_vector_dict[tester_cycle].merge_test_vector(test_vector=test_vector_dict[tester_cycle])
+        self._test_vector_dict.update(test_vector_dict)
+        self._test_vector_dict.update(merged_test_vector_dict)
+        return merged_tester_cycle_set
+
+
+    def sort(self, sort_test_vectors: bool=True) -> None:
+        self._check_writable()
         self._test_vector_dict = dict(sorted(self.test_vector_dict.items()))
-        for test_vector in self.test_vector_dict.values():
-            test_vector.sort()
+        if sort_test_vectors:
+            for test_vector in self.test_vector_dict.values():
+                test_vector.sort()
 
     
     def get_test_str(self) -> str:
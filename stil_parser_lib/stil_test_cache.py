@@ -0,0 +1,158 @@
+# standard packages
+from collections import OrderedDict
+from os import stat
+from os.path import realpath
+from sys import getsizeof
+from typing import Optional, Dict, Tuple
+
+
+# local packages
+from stil_test import StilTest
+from stil_signal_index import StilSignalIndex
+
+
+class StilTestCache():
+    EVENT_SIZE: int = getsizeof((None, None))
+
+
+    def __init__(self, memory_budget: int=1 << 30) -> None:
+        if memory_budget <= 0:
+            raise ValueError(f"Memory budget must be positive, got '{memory_budget}'")
+        self._memory_budget: int = memory_budget
+        self._memory_usage: int = 0
+        self._hit_count: int = 0
+        self._miss_count: int = 0
+        self._eviction_count: int = 0
+        # least recently used entries first, each entry records whether the signal index of the test is counted in its size
+        self._entry_dict: "OrderedDict[Tuple[str, int], Tuple[StilTest, int, bool]]" = OrderedDict()
+        self._key_dict: Dict[str, Tuple[str, int]] = {}
+
+
+    @property
+    def memory_budget(self) -> int:
+        return self._memory_budget
+
+
+    @property
+    def memory_usage(self) -> int:
+        return self._memory_usage
+
+
+    @property
+    def hit_count(self) -> int:
+        return self._hit_count
+
+
+    @property
+    def miss_count(self) -> int:
+        return self._miss_count
+
+
+    @property
+    def eviction_count(self) -> int:
+        return self._eviction_count
+
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._entry_dict)
+
+
+    def get_test(self, file_path: str) -> Optional[StilTest]:
+        key: Tuple[str, int] = StilTestCache._get_key(file_path=file_path)
+        entry: Optional[Tuple[StilTest, int, bool]] = self._entry_dict.get(key)
+        if entry is None:
+            self._miss_count+=1
+            return None
+        self._hit_count+=1
+        self._entry_dict.move_to_end(key)
+
+        # the signal index is built on first use by any caller of the shared test, it is counted on the next hit
+        stil_test, test_size, signal_index_counted = entry
+        if not signal_index_counted and stil_test.has_signal_index:
+            signal_index_size: int = StilTestCache.estimate_signal_index_size(signal_index=stil_test.signal_index)
+            self._entry_dict[key] = (stil_test, test_size + signal_index_size, True)
+            self._memory_usage+=signal_index_size
+            self._evict()
+        return stil_test
+
+
+    def add_test(self, file_path: str, stil_test: StilTest) -> None:
+        key: Tuple[str, int] = StilTestCache._get_key(file_path=file_path)
+        # an older version of the same file can never be hit again
+        previous_key: Optional[Tuple[str, int]] = self._key_dict.get(key[0])
+        if previous_key is not None:
+            self._remove_entry(key=previous_key)
+
+        # tests are shared between callers once cached, tests too large to be cached are frozen as well so the contract does not depend on size
+        stil_test.set_read_only()
+        test_size: int = StilTestCache.estimate_test_size(stil_test=stil_test)
+        if stil_test.has_signal_index:
+            test_size+=StilTestCache.estimate_signal_index_size(signal_index=stil_test.signal_index)
+        if test_size > self.memory_budget:
+            return
+
+        self._entry_dict[key] = (stil_test, test_size, stil_test.has_signal_index)
+        self._key_dict[key[0]] = key
+        self._memory_usage+=test_size
+        self._evict()
+
+
+    def clear(self) -> None:
+        self._entry_dict.clear()
+        self._key_dict.clear()
+        self._memory_usage = 0
+
+
+    @staticmethod
+    def estimate_test_size(stil_test: StilTest) -> int:
+        # signals, signal groups and waveforms are negligible next to the test vectors, event tuples share their signal and value
+        test_size: int = getsizeof(stil_test) + getsizeof(stil_test.test_vector_dict)
+        for test_vector in stil_test.test_vector_dict.values():
+            test_size+=getsizeof(test_vector) + getsizeof(test_vector.__dict__) + getsizeof(test_vector.test_vector)
+            for signal_value_tuple_list in test_vector.test_vector.values():
+                test_size+=getsizeof(signal_value_tuple_list) + len(signal_value_tuple_list)*StilTestCache.EVENT_SIZE
+        return test_size
+
+
+    @staticmethod
+    def estimate_signal_index_size(signal_index: StilSignalIndex) -> int:
+        signal_index_size: int = getsizeof(signal_index) + getsizeof(signal_index.__dict__)
+        for array_dict in (signal_index.tester_cycle_array_dict, signal_index.time_array_dict, signal_index.value_str_dict):
+            signal_index_size+=getsizeof(array_dict) + sum(map(getsizeof, array_dict.values()))
+        return signal_index_size
+
+
+    def _evict(self) -> None:
+        while self.memory_usage > self.memory_budget:
+            self._remove_entry(key=next(iter(self._entry_dict)))
+            self._eviction_count+=1
+
+
+    def _remove_entry(self, key: Tuple[str, int]) -> None:
+        _, test_size, _ = self._entry_dict.pop(key)
+        del self._key_dict[key[0]]
+        self._memory_usage-=test_size
+
+
+    @staticmethod
+    def _get_key(file_path: str) -> Tuple[str, int]:
+        resolved_path: str = realpath(file_path)
+        return resolved_path, stat(resolved_path).st_mtime_ns
+
+
+    def get_test_cache_str(self, indent_level: int=0) -> str:
+        indent_str="\t" * indent_level
+        test_cache_str: str = ""
+        test_cache_str+=f"{indent_str}{type(self).__qualname__}:\n"
+        test_cache_str+=f"{indent_str}\tmemory usage: '{self.memory_usage}/{self.memory_budget}'\n"
+        test_cache_str+=f"{indent_str}\thit count: '{self.hit_count}'\n"
+        test_cache_str+=f"{indent_str}\tmiss count: '{self.miss_count}'\n"
+        test_cache_str+=f"{indent_str}\teviction count: '{self.eviction_count}'\n"
+
+        test_cache_str+=f"{indent_str}\tentry list:\n"
+        for (file_path, _), (stil_test, test_size, _) in self._entry_dict.items():
+            test_cache_str+=f"{indent_str}\t\t'{file_path}': '{stil_test.name}' size: '{test_size}'\n"
+
+        test_cache_str=test_cache_str.removesuffix("\n")
+        return test_cache_str
@@ -1,5 +1,6 @@
 # standard packages
-from typing import Union, List, Dict, Tuple, Any
+from types import MappingProxyType
+from typing import Union, List, Dict, Tuple, Any, Mapping, Sequence
 
 
 # local packages
@@ -16,6 +17,7 @@ class StilTestVector():
         self._tester_cycle: int = tester_cycle
         self._waveform_table: StilWaveformTable = waveform_table
         self._test_vector: Dict[int, List[Tuple[StilSignal, Union[StilForce, StilCompare]]]] = {}
+        self._read_only: bool = False
 
 
     @property
@@ -29,11 +31,30 @@ class StilTestVector():
 
 
     @property
-    def test_vector(self) -> Dict[int, List[Tuple[StilSignal, Union[StilForce, StilCompare]]]]:
+    def test_vector(self) -> Mapping[int, Sequence[Tuple[StilSignal, Union[StilForce, StilCompare]]]]:
+        if self.read_only:
+            return MappingProxyType(self._test_vector)
         return self._test_vector
 
 
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+
+    def set_read_only(self) -> None:
+        # the event lists are replaced by tuples so they cannot be appended to through the read-only mapping
+        self._test_vector = {timestamp: tuple(signal_value_tuple_list) for timestamp, signal_value_tuple_list in self._test_vector.items()}
+        self._read_only = True
+
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise AttributeError(f"Test vector of tester cycle '{self.tester_cycle}' is read-only")
+
+
     def add_input_event(self, signal_group: StilSignalGroup, value_list: List[StilTimingInCondition]) -> None:
+        self._check_writable()
         for signal, value in zip(signal_group.signal_list, value_list):
             waveform: StilWaveform[StilTimingInCondition, StilForce] = self.get_waveform_from_signal(signal=signal)
             for timing_condition in waveform.timing_condition_list:
@@ -44,18 +65,19 @@ class StilTestVector():
                                 if (timing_condition == StilTimingInCondition.UNKNOWN and waveform_value == StilForce.NONE) or \
                                    (timing_condition == StilTimingInCondition.ZERO and waveform_value == StilForce.DOWN) or \
                                    (timing_condition == StilTimingInCondition.ONE and waveform_value == StilForce.UP):
-                                    if self.test_vector.get(timestamp) is None:
-                                        self.test_vector[timestamp] = [(signal, waveform_value)]
+                                    if self._test_vector.get(timestamp) is None:
+                                        self._test_vector[timestamp] = [(signal, waveform_value)]
                                     else:
-                                        self.test_vector[timestamp].append((signal, waveform_value))
+                                        self._test_vector[timestamp].append((signal, waveform_value))
                         else:
-                            if self.test_vector.get(timestamp) is None:
-                                self.test_vector[timestamp] = [(signal, waveform_value_list[0])]
+                            if self._test_vector.get(timestamp) is None:
+                                self._test_vector[timestamp] = [(signal, waveform_value_list[0])]
                             else:
-                                self.test_vector[timestamp].append((signal, waveform_value_list[0]))
+                                self._test_vector[timestamp].append((signal, waveform_value_list[0]))
 
 
     def add_output_event(self, signal_group: StilSignalGroup, value_list: List[StilTimingOutCondition]) -> None:
+        self._check_writable()
         for signal, value in zip(signal_group.signal_list, value_list):
             waveform: StilWaveform[StilTimingOutCondition, StilCompare] = self.get_waveform_from_signal(signal=signal)
             for timing_condition in waveform.timing_condition_list:
@@ -64,26 +86,40 @@ class StilTestVector():
                         if len(waveform_value_list) > 1:
                             for waveform_value in waveform_value_list:
                                 if (timing_condition.value == waveform_value.value):
-                                    if self.test_vector.get(timestamp) is None:
-                                        self.test_vector[timestamp] = [(signal, waveform_value)]
+                                    if self._test_vector.get(timestamp) is None:
+                                        self._test_vector[timestamp] = [(signal, waveform_value)]
                                     else:
-                                        self.test_vector[timestamp].append((signal, waveform_value))
+                                        self._test_vector[timestamp].append((signal, waveform_value))
                         else:
-                            if self.test_vector.get(timestamp) is None:
-                                self.test_vector[timestamp] = [(signal, waveform_value_list[0])]
+                            if self._test_vector.get(timestamp) is None:
+                                self._test_vector[timestamp] = [(signal, waveform_value_list[0])]
                             else:
-                                self.test_vector[timestamp].append((signal, waveform_value_list[0]))
+                                self._test_vector[timestamp].append((signal, waveform_value_list[0]))
+
+
+    def merge_test_vector(self, test_vector: "StilTestVector") -> None:
+        self._check_writable()
+        if test_vector.tester_cycle != self.tester_cycle:
+            raise ValueError(f"Cannot merge test vector of tester cycle '{test_vector.tester_cycle}' into test vector of tester cycle '{self.tester_cycle}'")
+        if test_vector.waveform_table is not self.waveform_table:
+            raise ValueError(f"Cannot merge test vectors of tester cycle '{self.tester_cycle}' associated with different waveform tables")
+        for timestamp, signal_value_tuple_list in test_vector.test_vector.items():
+            if self._test_vector.get(timestamp) is None:
+                self._test_vector[timestamp] = list(signal_value_tuple_list)
+            else:
+                self._test_vector[timestamp].extend(signal_value_tuple_list)
 
 
     def get_waveform_from_signal(self, signal: StilSignal) -> StilWaveform[Any, Any]:
         for signal_group_name, waveform in self.waveform_table.waveform_dict.items():
-            if signal in waveform.signal_group.signal_list:
+            if waveform.signal_group.has_signal(signal=signal):
                 return self.waveform_table.waveform_dict[signal_group_name]
         raise ValueError(f"Could not find matching waveform for signal '{signal.name}'")
 
 
     def sort(self) -> None:
-        self._test_vector = dict(sorted(self.test_vector.items()))
+        self._check_writable()
+        self._test_vector = dict(sorted(self._test_vector.items()))
 
 
     def get_test_vector_str(self, indent_level: int=0) -> str:
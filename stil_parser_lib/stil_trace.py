@@ -0,0 +1,144 @@
+# standard packages
+from array import array
+from bisect import bisect_right
+from itertools import islice
+from operator import le
+from typing import Dict, List, Iterable, Iterator, Optional, Match
+from re import search
+
+
+# local packages
+from stil_waveform import StilUnits
+
+
+class StilTrace():
+    VALUE_STR: str = "01xz"
+
+
+    def __init__(self, timescale: int=1, units: StilUnits=StilUnits.NS) -> None:
+        if timescale <= 0:
+            raise ValueError(f"Timescale must be positive, got '{timescale}'")
+        self._timescale: int = timescale
+        self._units: StilUnits = units
+        self._time_array_dict: Dict[str, array] = {}
+        self._value_str_dict: Dict[str, str] = {}
+
+
+    @property
+    def timescale(self) -> int:
+        return self._timescale
+
+
+    @property
+    def units(self) -> StilUnits:
+        return self._units
+
+
+    @property
+    def time_array_dict(self) -> Dict[str, array]:
+        return self._time_array_dict
+
+
+    @property
+    def value_str_dict(self) -> Dict[str, str]:
+        return self._value_str_dict
+
+
+    def add_signal_trace(self, signal_name: str, time_list: Iterable[int], value_list: Iterable[str]) -> None:
+        if signal_name in self.time_array_dict:
+            raise AttributeError(f"Signal '{signal_name}' already in '{list(self.time_array_dict.keys())}'")
+        time_array: array = array("q", time_list)
+        value_str: str = "".join(value_list).lower()
+        if len(time_array) != len(value_str):
+            raise ValueError(f"Signal '{signal_name}' has '{len(time_array)}' timestamps but '{len(value_str)}' values")
+        if value_str.strip(StilTrace.VALUE_STR) != "":
+            raise ValueError(f"Signal '{signal_name}' has values outside of '{StilTrace.VALUE_STR}'")
+        if not all(map(le, time_array, islice(time_array, 1, None))):
+            raise ValueError(f"Timestamps of signal '{signal_name}' are not sorted")
+        self._time_array_dict[signal_name] = time_array
+        self._value_str_dict[signal_name] = value_str
+
+
+    def get_value(self, signal_name: str, time: int) -> str:
+        change_idx: int = bisect_right(self.time_array_dict[signal_name], time)
+        return self.value_str_dict[signal_name][change_idx-1] if change_idx > 0 else "x"
+
+
+    @staticmethod
+    def gen_trace_from_vcd(file_path: str) -> "StilTrace":
+        with open(file_path) as vcd_file:
+            token_iter: Iterator[str] = (token for line in vcd_file for token in line.split())
+            timescale: int = 1
+            units: StilUnits = StilUnits.NS
+            id_dict: Dict[str, List[str]] = {}
+            time_list_dict: Dict[str, List[int]] = {}
+            value_list_dict: Dict[str, List[str]] = {}
+
+            for token in token_iter:
+                if token == "$timescale":
+                    timescale_str: str = "".join(StilTrace._read_vcd_section(token_iter=token_iter))
+                    timescale_match: Optional[Match[str]] = search(r"^(\d+)(ms|us|ns|ps|fs)$", timescale_str)
+                    if timescale_match is None:
+                        raise ValueError(f"Could not extract timescale from '{timescale_str}'")
+                    timescale = int(timescale_match.group(1))
+                    units = StilUnits(timescale_match.group(2))
+                elif token == "$var":
+                    var_list: List[str] = StilTrace._read_vcd_section(token_iter=token_iter)
+                    if len(var_list) < 4:
+                        raise ValueError(f"Could not extract variable from '{var_list}'")
+                    # only scalar variables can match a stil signal, the first scope declaring a name wins
+                    if var_list[1] == "1" and var_list[3] not in time_list_dict:
+                        id_dict.setdefault(var_list[2], []).append(var_list[3])
+                        time_list_dict[var_list[3]] = []
+                        value_list_dict[var_list[3]] = []
+                elif token == "$enddefinitions":
+                    StilTrace._read_vcd_section(token_iter=token_iter)
+                    break
+                elif token.startswith("$"):
+                    StilTrace._read_vcd_section(token_iter=token_iter)
+
+            time: int = 0
+            for token in token_iter:
+                if token[0] == "#":
+                    time = int(token[1:])
+                elif token[0] in "01xzXZ":
+                    for signal_name in id_dict.get(token[1:], []):
+                        time_list_dict[signal_name].append(time)
+                        value_list_dict[signal_name].append(token[0])
+                elif token[0] in "bBrR":
+                    next(token_iter)
+                elif token in ("$comment", "$date", "$version"):
+                    StilTrace._read_vcd_section(token_iter=token_iter)
+
+        stil_trace: StilTrace = StilTrace(timescale=timescale, units=units)
+        for signal_name in time_list_dict:
+            stil_trace.add_signal_trace(
+                signal_name=signal_name,
+                time_list=time_list_dict[signal_name],
+                value_list=value_list_dict[signal_name]
+            )
+        return stil_trace
+
+
+    @staticmethod
+    def _read_vcd_section(token_iter: Iterator[str]) -> List[str]:
+        section_list: List[str] = []
+        for token in token_iter:
+            if token == "$end":
+                return section_list
+            section_list.append(token)
+        raise ValueError("Reached the end of the vcd file before '$end'")
+
+
+    def get_trace_str(self, indent_level: int=0) -> str:
+        indent_str="\t" * indent_level
+        trace_str: str = ""
+        trace_str+=f"{indent_str}{type(self).__qualname__}:\n"
+        trace_str+=f"{indent_str}\ttimescale: '{self.timescale}{self.units.value}'\n"
+
+        trace_str+=f"{indent_str}\tsignal list: \n"
+        for signal_name, time_array in self.time_array_dict.items():
+            trace_str+=f"{indent_str}\t\tsignal: '{signal_name}' changes: '{len(time_array)}'\n"
+
+        trace_str=trace_str.removesuffix("\n")
+        return trace_str
@@ -0,0 +1,165 @@
+# standard packages
+from bisect import bisect_right
+from itertools import repeat, compress
+from operator import mul, add, contains
+from typing import Dict, List
+
+
+# local packages
+from stil_waveform import StilCompare, StilUnits
+from stil_test import StilTest
+from stil_trace import StilTrace
+from stil_signal_index import StilSignalIndex
+
+
+class StilMismatch():
+    def __init__(self, tester_cycle: int, timestamp: int, signal_name: str, expected: StilCompare, actual: str) -> None:
+        self._tester_cycle: int = tester_cycle
+        self._timestamp: int = timestamp
+        self._signal_name: str = signal_name
+        self._expected: StilCompare = expected
+        self._actual: str = actual
+
+
+    @property
+    def tester_cycle(self) -> int:
+        return self._tester_cycle
+
+
+    @property
+    def timestamp(self) -> int:
+        return self._timestamp
+
+
+    @property
+    def signal_name(self) -> str:
+        return self._signal_name
+
+
+    @property
+    def expected(self) -> StilCompare:
+        return self._expected
+
+
+    @property
+    def actual(self) -> str:
+        return self._actual
+
+
+    def get_mismatch_str(self, indent_level: int=0) -> str:
+        indent_str="\t" * indent_level
+        return f"{indent_str}'{self.tester_cycle}' '{self.timestamp}': '{self.signal_name}' expected '{self.expected.value}' got '{self.actual}'"
+
+
+class StilCompareResult():
+    def __init__(self) -> None:
+        self._compare_count: int = 0
+        self._mismatch_list: List[StilMismatch] = []
+        self._failure_count_dict: Dict[str, int] = {}
+
+
+    @property
+    def compare_count(self) -> int:
+        return self._compare_count
+
+
+    @property
+    def mismatch_list(self) -> List[StilMismatch]:
+        return self._mismatch_list
+
+
+    @property
+    def failure_count_dict(self) -> Dict[str, int]:
+        return self._failure_count_dict
+
+
+    @property
+    def passed(self) -> bool:
+        return len(self.mismatch_list) == 0
+
+
+    def add_signal_result(self, signal_name: str, compare_count: int, mismatch_list: List[StilMismatch]) -> None:
+        self._compare_count+=compare_count
+        self._failure_count_dict[signal_name] = self.failure_count_dict.get(signal_name, 0) + len(mismatch_list)
+        self._mismatch_list.extend(mismatch_list)
+
+
+    def sort(self) -> None:
+        self._mismatch_list.sort(key=lambda mismatch: (mismatch.tester_cycle, mismatch.timestamp, mismatch.signal_name))
+
+
+    def get_compare_result_str(self, indent_level: int=0) -> str:
+        indent_str="\t" * indent_level
+        compare_result_str: str = ""
+        compare_result_str+=f"{indent_str}{type(self).__qualname__}:\n"
+        compare_result_str+=f"{indent_str}\tcompare count: '{self.compare_count}'\n"
+
+        compare_result_str+=f"{indent_str}\tfailure count dict:\n"
+        for signal_name, failure_count in self.failure_count_dict.items():
+            compare_result_str+=f"{indent_str}\t\t'{signal_name}': '{failure_count}'\n"
+
+        compare_result_str+=f"{indent_str}\tmismatch list:\n"
+        for mismatch in self.mismatch_list:
+            compare_result_str+=f"{mismatch.get_mismatch_str(indent_level=indent_level+2)}\n"
+
+        compare_result_str=compare_result_str.removesuffix("\n")
+        return compare_result_str
+
+
+class StilTraceCompare():
+    FS_PER_UNIT: Dict[StilUnits, int] = {
+        StilUnits.MS: 10**12,
+        StilUnits.US: 10**9,
+        StilUnits.NS: 10**6,
+        StilUnits.PS: 10**3,
+        StilUnits.FS: 1
+    }
+    COMPARED_CODE_STR: str = "HLT"
+    EXPECTED_VALUE_TABLE: Dict[int, str] = str.maketrans("HLT", "10z")
+
+
+    @staticmethod
+    def compare_trace(stil_test: StilTest, stil_trace: StilTrace, time_offset: int=0) -> StilCompareResult:
+        # tester cycle N starts at N*period+time_offset, in the units of the stil test
+        stil_fs: int = StilTraceCompare.FS_PER_UNIT[stil_test.waveform_table.units]
+        trace_fs: int = stil_trace.timescale*StilTraceCompare.FS_PER_UNIT[stil_trace.units]
+        signal_index: StilSignalIndex = stil_test.signal_index
+
+        stil_compare_result: StilCompareResult = StilCompareResult()
+        for signal_name, value_str in signal_index.value_str_dict.items():
+            # selects the H, L and T events of the signal, don't care and input events are not compared
+            compared_list: List[bool] = list(map(contains, repeat(StilTraceCompare.COMPARED_CODE_STR), value_str))
+            if not any(compared_list):
+                continue
+            if signal_name not in stil_trace.time_array_dict:
+                raise ValueError(f"Signal '{signal_name}' is compared in test '{stil_test.name}' but not found in trace")
+
+            code_str: str = "".join(compress(value_str, compared_list))
+            expected_str: str = code_str.translate(StilTraceCompare.EXPECTED_VALUE_TABLE)
+            time_list: List[int] = list(compress(signal_index.time_array_dict[signal_name], compared_list))
+
+            # the whole signal is compared with C-level map/bisect calls, bisect is faster on a list than on an array
+            trace_time_list: List[int] = list(map(mul, stil_trace.time_array_dict[signal_name], repeat(trace_fs)))
+            # index 0 is the value before the first change
+            trace_value_str: str = "x" + stil_trace.value_str_dict[signal_name]
+            actual_str: str = "".join(map(
+                trace_value_str.__getitem__,
+                map(bisect_right, repeat(trace_time_list), map(mul, map(add, time_list, repeat(time_offset)), repeat(stil_fs)))
+            ))
+
+            mismatch_list: List[StilMismatch] = []
+            if actual_str != expected_str:
+                tester_cycle_list: List[int] = list(compress(signal_index.tester_cycle_array_dict[signal_name], compared_list))
+                for i, (expected, actual) in enumerate(zip(expected_str, actual_str)):
+                    if expected != actual:
+                        mismatch_list.append(StilMismatch(
+                            tester_cycle=tester_cycle_list[i],
+                            timestamp=time_list[i] - tester_cycle_list[i]*signal_index.period,
+                            signal_name=signal_name,
+                            expected=StilCompare(code_str[i]),
+                            actual=actual
+                        ))
+            stil_compare_result.add_signal_result(signal_name=signal_name, compare_count=len(expected_str), mismatch_list=mismatch_list)
+
+        stil_compare_result.sort()
+        return stil_compare_result
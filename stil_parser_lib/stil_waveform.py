@@ -1,6 +1,7 @@
 # standard packages
 from enum import Enum
-from typing import TypeVar, Generic, List, Dict
+from types import MappingProxyType
+from typing import TypeVar, Generic, List, Dict, Mapping, Sequence
 
 
 # local packages
@@ -56,6 +57,7 @@ class StilWaveform(Generic[TCond, TVal]):
         timestamp_dict: Dict[int, List[TVal]]={}) -> None:
 
         self._signal_group: StilSignalGroup = signal_group
+        self._read_only: bool = False
         
         self._period = period
         self._units = units
@@ -84,33 +86,54 @@ class StilWaveform(Generic[TCond, TVal]):
         return self._units
 
     @property
-    def timing_condition_list(self) -> List[TCond]:
+    def timing_condition_list(self) -> Sequence[TCond]:
         return self._timing_condition_list
 
     
     @property
-    def timestamp_dict(self) -> Dict[int, List[TVal]]:
+    def timestamp_dict(self) -> Mapping[int, Sequence[TVal]]:
+        if self.read_only:
+            return MappingProxyType(self._timestamp_dict)
         return self._timestamp_dict
 
 
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+
+    def set_read_only(self) -> None:
+        # the lists are replaced by tuples so they cannot be appended to through the properties
+        self._timing_condition_list = tuple(self._timing_condition_list)
+        self._timestamp_dict = {timestamp_key: tuple(timestamp_value_list) for timestamp_key, timestamp_value_list in self._timestamp_dict.items()}
+        self._read_only = True
+
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise AttributeError(f"Waveform of signal group '{self.signal_group.name}' is read-only")
+
+
     def add_timing_condition(self, timing_condition: TCond) -> None:
+        self._check_writable()
         if (self.signal_group.signal_type == StilSignalType.INPUT and type(timing_condition) == StilTimingOutCondition) or \
            (self.signal_group.signal_type == StilSignalType.OUTPUT and type(timing_condition) == StilTimingInCondition):
             raise TypeError(f"Cannot associate signal group of type '{self._signal_group.signal_type}' with timestamp condition of type '{type(timing_condition).__qualname__}'")
         if timing_condition not in self.timing_condition_list:
-            self.timing_condition_list.append(timing_condition)
+            self._timing_condition_list.append(timing_condition)
 
 
     def add_timestamp(self, timestamp_key: int, timestamp_value: TVal) -> None:
+        self._check_writable()
         if timestamp_key > self.period:
             raise ValueError(f"Timestamp key '{timestamp_key}{self.units}' cannot be higher than period '{self.period}{self.units}'")
         if (self.signal_group.signal_type == StilSignalType.INPUT and type(timestamp_value) == StilCompare) or \
            (self.signal_group.signal_type == StilSignalType.OUTPUT and type(timestamp_value) == StilForce):
                 raise TypeError(f"Cannot associate signal group of type '{self._signal_group.signal_type}' with timing value of type '{type(timestamp_value).__qualname__}'")
-        if self.timestamp_dict.get(timestamp_key) is not None:
-            self.timestamp_dict[timestamp_key].append(timestamp_value)
+        if self._timestamp_dict.get(timestamp_key) is not None:
+            self._timestamp_dict[timestamp_key].append(timestamp_value)
         else:
-            self.timestamp_dict[timestamp_key] = [timestamp_value]
+            self._timestamp_dict[timestamp_key] = [timestamp_value]
 
 
     def add_timing_condition_list(self, timing_condition_list: List[TCond]) -> None:
@@ -1,5 +1,6 @@
 # standard packages
-from typing import List, Any, Dict, Union
+from types import MappingProxyType
+from typing import List, Any, Dict, Union, Mapping
 
 
 # local packages
@@ -16,6 +17,7 @@ class StilWaveformTable():
 
         self._period = period
         self._units = units
+        self._read_only: bool = False
 
         self._waveform_dict: Dict[str, StilWaveform[Any, Any]] = {}
         if len(waveform_list)>0:
@@ -33,14 +35,33 @@ class StilWaveformTable():
 
 
     @property
-    def waveform_dict(self) -> Dict[str, StilWaveform[Any, Any]]:
+    def waveform_dict(self) -> Mapping[str, StilWaveform[Any, Any]]:
+        if self.read_only:
+            return MappingProxyType(self._waveform_dict)
         return self._waveform_dict
 
 
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+
+    def set_read_only(self) -> None:
+        for waveform in self._waveform_dict.values():
+            waveform.set_read_only()
+        self._read_only = True
+
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise AttributeError("Waveform table is read-only")
+
+
     def add_waveform(self, waveform: StilWaveform[Any, Any]) -> None:
+        self._check_writable()
         if waveform.period != self.period or waveform.units != self.units:
             raise ValueError(f"Waveform with period '{waveform.period}{waveform.units}' is not compatible with waveform table with period '{self.period}{self.units}'")
-        self.waveform_dict[waveform.signal_group.name] = waveform
+        self._waveform_dict[waveform.signal_group.name] = waveform
 
 
     def add_waveform_list(self, waveform_list: List[StilWaveform[Any, Any]]) -> None:
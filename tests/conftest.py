@@ -0,0 +1,7 @@
+# standard packages
+import sys
+from os.path import abspath, dirname, join
+
+
+# the library modules import each other by module name
+sys.path.insert(0, join(dirname(dirname(abspath(__file__))), "stil_parser_lib"))
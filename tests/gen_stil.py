@@ -0,0 +1,63 @@
+# standard packages
+from random import Random
+from typing import List
+
+
+# local packages
+from stil_parser import StilParser
+from stil_test import StilTest
+
+
+STIL_HEADER: str = """STIL 1.0;
+Header {
+   Title "gen_test";
+}
+Signals {
+   "a" In; "b" In; "c" In;
+   "y" Out; "z" Out;
+}
+SignalGroups {
+   _pi = '"a" + "b" + "c"';
+   _po = '"y" + "z"';
+}
+Timing RETARGET_timing {
+   WaveformTable RETARGET_timing {
+      Period '100ns';
+      Waveforms  {
+         _pi { 01N { '0ns' D/U/N; }}
+         _po { LHXT { '0ns' X; '40ns' L/H/X/T; }}
+      }
+   }
+}
+Pattern "gen_test" {
+"""
+
+
+def gen_stil_str(cycle_count: int, tester_cycle_annotation: bool=True, seed: int=0) -> str:
+    random: Random = Random(seed)
+    stil_str: str = STIL_HEADER
+    for tester_cycle in range(cycle_count):
+        if tester_cycle_annotation:
+            stil_str+=f"   Ann {{* TesterCycle:{tester_cycle} *}}\n"
+        # some cycles only have input or output events
+        block_kind: int = random.randrange(4)
+        stil_str+="   V {\n"
+        if block_kind != 1:
+            stil_str+=f"      _pi = {''.join(random.choice('01N') for _ in range(3))};\n"
+        if block_kind != 2:
+            stil_str+=f"      _po = {''.join(random.choice('LHXT') for _ in range(2))};\n"
+        stil_str+="   }\n"
+    stil_str+="}\n"
+    return stil_str
+
+
+def write_stil(directory: str, stil_str: str, newline: str) -> str:
+    with open(f"{directory}/gen_test.stil", "w", newline=newline) as stil_file:
+        stil_file.write(stil_str)
+    return "gen_test"
+
+
+def parse_stil(directory: str, stil: str, **parse_kwargs) -> StilTest:
+    stil_test_list: List[StilTest] = StilParser.gen_tests_from_stil(directory_list=[directory], stil_list=[stil], **parse_kwargs)
+    assert len(stil_test_list) == 1
+    return stil_test_list[0]
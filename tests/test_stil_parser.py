@@ -0,0 +1,200 @@
+# standard packages
+import asyncio
+import gzip
+import lzma
+import os
+import threading
+import time
+from contextlib import aclosing, closing
+from typing import Any, Coroutine, List
+
+import pytest
+
+
+# optional packages
+try:
+    import zstandard
+except ModuleNotFoundError:
+    zstandard = None
+
+
+# local packages
+from stil_parser import StilParser
+from stil_test import StilTest
+from stil_test_vector import StilTestVector
+from gen_stil import gen_stil_str, write_stil, parse_stil
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("tester_cycle_annotation", [True, False])
+def test_mmap_matches_text(tmp_path, newline: str, tester_cycle_annotation: bool) -> None:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=gen_stil_str(cycle_count=200, tester_cycle_annotation=tester_cycle_annotation), newline=newline)
+    text_test: StilTest = parse_stil(directory=str(tmp_path), stil=stil)
+    mmap_test: StilTest = parse_stil(directory=str(tmp_path), stil=stil, use_mmap=True)
+    assert len(text_test.test_vector_dict) == (200 if tester_cycle_annotation else 1)
+    assert mmap_test.get_test_str() == text_test.get_test_str()
+
+
+@pytest.mark.parametrize("process_count", [2, 3])
+@pytest.mark.parametrize("tester_cycle_annotation", [True, False])
+def test_parallel_matches_text(tmp_path, process_count: int, tester_cycle_annotation: bool) -> None:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=gen_stil_str(cycle_count=200, tester_cycle_annotation=tester_cycle_annotation), newline="\n")
+    text_test: StilTest = parse_stil(directory=str(tmp_path), stil=stil)
+    parallel_test: StilTest = parse_stil(directory=str(tmp_path), stil=stil, process_count=process_count)
+    assert parallel_test.get_test_str() == text_test.get_test_str()
+    # the merged events reference the signals and waveform table of the returned test
+    for test_vector in parallel_test.test_vector_dict.values():
+        assert test_vector.waveform_table is parallel_test.waveform_table
+        for signal_value_tuple_list in test_vector.test_vector.values():
+            for signal, _ in signal_value_tuple_list:
+                assert signal is parallel_test.signal_dict[signal.name]
+
+
+COMPRESS_DICT = {
+    "gzip": (".stil.gz", gzip.compress),
+    "xz": (".stil.xz", lzma.compress),
+    "zstd": (".stil.zst", None if zstandard is None else zstandard.ZstdCompressor().compress),
+}
+
+
+@pytest.mark.parametrize("plain_suffix", [False, True])
+@pytest.mark.parametrize("compression", list(COMPRESS_DICT.keys()))
+def test_compressed_matches_text(tmp_path, compression: str, plain_suffix: bool) -> None:
+    suffix, compress = COMPRESS_DICT[compression]
+    if compress is None:
+        pytest.skip("zstandard is not installed")
+    stil_str: str = gen_stil_str(cycle_count=200)
+    text_test: StilTest = parse_stil(directory=str(tmp_path), stil=write_stil(directory=str(tmp_path), stil_str=stil_str, newline="\n"))
+
+    # a compressed file saved with a plain .stil name is detected from its magic bytes
+    compressed_dir: str = str(tmp_path / "compressed")
+    os.mkdir(compressed_dir)
+    with open(f"{compressed_dir}/gen_test{'.stil' if plain_suffix else suffix}", "wb") as compressed_file:
+        compressed_file.write(compress(stil_str.encode()))
+    for parse_kwargs in ({}, {"use_mmap": True}, {"process_count": 2}):
+        compressed_test: StilTest = parse_stil(directory=compressed_dir, stil="gen_test", **parse_kwargs)
+        assert compressed_test.get_test_str() == text_test.get_test_str()
+
+
+@pytest.mark.parametrize("block_str, error_str", [
+    ("   V {\n      _pi 010;\n   }\n", "_pi 010;"),
+    ("   V {\n      _pi = 010;\n", "before the end of the test vector block"),
+])
+def test_mmap_malformed_block(tmp_path, block_str: str, error_str: str) -> None:
+    stil_str: str = gen_stil_str(cycle_count=5).removesuffix("}\n") + block_str
+    stil: str = write_stil(directory=str(tmp_path), stil_str=stil_str, newline="\n")
+    with pytest.raises(ValueError, match=error_str):
+        parse_stil(directory=str(tmp_path), stil=stil, use_mmap=True)
+
+
+def run_without_event_loop(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    # cocotb drives coroutines by sending into them itself, so anything that needs an asyncio loop would be yielded out here
+    try:
+        coroutine.send(None)
+    except StopIteration as e:
+        return e.value
+    raise AssertionError("The coroutine awaited an object of an event loop")
+
+
+async def collect_test_vector_list(file_path: str) -> List[StilTestVector]:
+    return [test_vector async for test_vector in StilParser.aiter_stil(file_path=file_path, queue_depth=4)]
+
+
+def get_test_vector_str_list(test_vector_list: List[StilTestVector]) -> List[str]:
+    return [test_vector.get_test_vector_str() for test_vector in test_vector_list]
+
+
+def wait_for_producer_exit(file_path: str, timeout: float=2.0) -> bool:
+    deadline: float = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not any(thread.name == f"{StilParser.PRODUCER_THREAD_NAME} '{file_path}'" for thread in threading.enumerate()):
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_iter_stil_matches_gen_tests(tmp_path) -> None:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=gen_stil_str(cycle_count=200), newline="\n")
+    file_path: str = f"{tmp_path}/{stil}.stil"
+    stil_test: StilTest = parse_stil(directory=str(tmp_path), stil=stil)
+    expected_str_list: List[str] = get_test_vector_str_list(list(stil_test.test_vector_dict.values()))
+    assert list(stil_test.test_vector_dict.keys()) == list(range(200))
+
+    test_vector_list: List[StilTestVector] = list(StilParser.iter_stil(file_path=file_path, queue_depth=4))
+    assert [test_vector.tester_cycle for test_vector in test_vector_list] == list(range(200))
+    assert get_test_vector_str_list(test_vector_list) == expected_str_list
+    assert get_test_vector_str_list(asyncio.run(collect_test_vector_list(file_path=file_path))) == expected_str_list
+    assert get_test_vector_str_list(run_without_event_loop(collect_test_vector_list(file_path=file_path))) == expected_str_list
+
+
+def count_pop_sorted_test_vector(monkeypatch) -> List[int]:
+    pop_count_list: List[int] = [0]
+    pop_sorted_test_vector = StilParser._pop_sorted_test_vector
+
+    def counting_pop_sorted_test_vector(**kwargs) -> StilTestVector:
+        pop_count_list[0]+=1
+        return pop_sorted_test_vector(**kwargs)
+
+    monkeypatch.setattr(StilParser, "_pop_sorted_test_vector", staticmethod(counting_pop_sorted_test_vector))
+    return pop_count_list
+
+
+def test_iter_stil_backpressure(tmp_path, monkeypatch) -> None:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=gen_stil_str(cycle_count=200), newline="\n")
+    pop_count_list: List[int] = count_pop_sorted_test_vector(monkeypatch)
+    with closing(StilParser.iter_stil(file_path=f"{tmp_path}/{stil}.stil", queue_depth=4)) as test_vector_iter:
+        next(test_vector_iter)
+        time.sleep(0.5)
+        # one vector consumed, four waiting in the queue and one held by the blocked producer
+        assert pop_count_list[0] == 6
+        next(test_vector_iter)
+        time.sleep(0.5)
+        assert pop_count_list[0] == 7
+
+
+def test_aiter_stil_backpressure(tmp_path, monkeypatch) -> None:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=gen_stil_str(cycle_count=200), newline="\n")
+    pop_count_list: List[int] = count_pop_sorted_test_vector(monkeypatch)
+
+    async def consume() -> None:
+        async with aclosing(StilParser.aiter_stil(file_path=f"{tmp_path}/{stil}.stil", queue_depth=4)) as test_vector_aiter:
+            await test_vector_aiter.__anext__()
+            await asyncio.sleep(0.5)
+            assert pop_count_list[0] == 6
+
+    asyncio.run(consume())
+
+
+@pytest.mark.parametrize("pattern_str, error_str", [
+    ("   Ann {* TesterCycle:x *}\n   V {\n      _pi = 010;\n   }\n}\n", "Could not extract tester cycle"),
+    ("   Ann {* TesterCycle:1 *}\n   V {\n      _pi = 010;\n   }\n   Ann {* TesterCycle:0 *}\n   V {\n      _pi = 010;\n   }\n}\n", "comes after tester cycle"),
+])
+def test_iter_stil_error_reaches_consumer(tmp_path, pattern_str: str, error_str: str) -> None:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=gen_stil_str(cycle_count=0).removesuffix("}\n") + pattern_str, newline="\n")
+    file_path: str = f"{tmp_path}/{stil}.stil"
+    with pytest.raises(ValueError, match=error_str):
+        list(StilParser.iter_stil(file_path=file_path))
+    with pytest.raises(ValueError, match=error_str):
+        asyncio.run(collect_test_vector_list(file_path=file_path))
+    with pytest.raises(ValueError, match=error_str):
+        run_without_event_loop(collect_test_vector_list(file_path=file_path))
+
+
+def test_iter_stil_early_exit_stops_producer(tmp_path) -> None:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=gen_stil_str(cycle_count=200), newline="\n")
+    file_path: str = f"{tmp_path}/{stil}.stil"
+
+    with closing(StilParser.iter_stil(file_path=file_path, queue_depth=4)) as test_vector_iter:
+        for test_vector in test_vector_iter:
+            break
+    assert wait_for_producer_exit(file_path=file_path)
+
+    async def consume() -> None:
+        async with aclosing(StilParser.aiter_stil(file_path=file_path, queue_depth=4)) as test_vector_aiter:
+            async for test_vector in test_vector_aiter:
+                break
+
+    asyncio.run(consume())
+    assert wait_for_producer_exit(file_path=file_path)
+    run_without_event_loop(consume())
+    assert wait_for_producer_exit(file_path=file_path)
@@ -0,0 +1,75 @@
+# standard packages
+from typing import List
+
+import pytest
+
+
+# local packages
+from stil_signal import StilSignal, StilSignalType
+from stil_signal_group import StilSignalGroup
+
+
+@pytest.fixture
+def signal_list() -> List[StilSignal]:
+    return [StilSignal(name=name, signal_type=StilSignalType.INPUT) for name in "abcd"]
+
+
+@pytest.fixture
+def signal_group(signal_list: List[StilSignal]) -> StilSignalGroup:
+    signal_group: StilSignalGroup = StilSignalGroup(name="_pi")
+    signal_group.add_signal_from_list(signal_list)
+    return signal_group
+
+
+def check_positions(signal_group: StilSignalGroup, signal_list: List[StilSignal]) -> None:
+    assert list(signal_group.signal_list) == signal_list
+    for signal_position, signal in enumerate(signal_list):
+        assert signal_group.get_signal_position(signal=signal) == signal_position
+        assert signal_group.get_signal_position_from_name(signal_name=signal.name) == signal_position
+        assert signal_group.get_signal_from_position(signal_position=signal_position) is signal
+        assert signal_group.get_signal_from_name(signal_name=signal.name) is signal
+        assert signal_group.has_signal(signal=signal)
+        assert signal_group.is_in_group(signal_name=signal.name)
+
+
+@pytest.mark.parametrize("from_name", [False, True])
+def test_remove_signal_from_middle(signal_group: StilSignalGroup, signal_list: List[StilSignal], from_name: bool) -> None:
+    removed_signal: StilSignal = signal_list[1]
+    if from_name:
+        signal_group.remove_signal_from_name(signal_name=removed_signal.name)
+    else:
+        signal_group.remove_signal(signal=removed_signal)
+
+    # the signals after the removed one move down by one position
+    check_positions(signal_group=signal_group, signal_list=[signal_list[0], signal_list[2], signal_list[3]])
+    assert not signal_group.has_signal(signal=removed_signal)
+    assert not signal_group.is_in_group(signal_name=removed_signal.name)
+    with pytest.raises(ValueError):
+        signal_group.get_signal_position(signal=removed_signal)
+    with pytest.raises(ValueError):
+        signal_group.get_signal_position_from_name(signal_name=removed_signal.name)
+    with pytest.raises(ValueError):
+        signal_group.get_signal_from_position(signal_position=3)
+
+    # the removed signal can be added back at the end
+    signal_group.add_signal(signal=removed_signal)
+    check_positions(signal_group=signal_group, signal_list=[signal_list[0], signal_list[2], signal_list[3], removed_signal])
+
+
+def test_remove_unknown_signal(signal_group: StilSignalGroup, signal_list: List[StilSignal]) -> None:
+    signal_group.remove_signal(signal=StilSignal(name="a", signal_type=StilSignalType.INPUT))
+    signal_group.remove_signal_from_name(signal_name="e")
+    check_positions(signal_group=signal_group, signal_list=signal_list)
+
+
+def test_empty(signal_group: StilSignalGroup, signal_list: List[StilSignal]) -> None:
+    signal_group.empty()
+    assert list(signal_group.signal_list) == []
+    for signal in signal_list:
+        assert not signal_group.has_signal(signal=signal)
+        assert not signal_group.is_in_group(signal_name=signal.name)
+    with pytest.raises(ValueError):
+        signal_group.get_signal_from_position(signal_position=0)
+
+    signal_group.add_signal_from_list(list(reversed(signal_list)))
+    check_positions(signal_group=signal_group, signal_list=list(reversed(signal_list)))
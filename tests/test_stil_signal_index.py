@@ -0,0 +1,93 @@
+# standard packages
+import pytest
+
+
+# local packages
+from stil_test import StilTest
+from stil_signal_index import StilSignalIndex
+from stil_waveform import StilForce, StilCompare, StilTimingInCondition
+from gen_stil import STIL_HEADER, write_stil, parse_stil
+
+
+# inputs are driven at 0ns and outputs compared at 40ns in each 100ns cycle, outputs are X at 0ns
+PATTERN_STR: str = """   Ann {* TesterCycle:0 *}
+   V {
+      _pi = 010;
+      _po = LH;
+   }
+   Ann {* TesterCycle:1 *}
+   V {
+      _pi = 110;
+   }
+   Ann {* TesterCycle:2 *}
+   V {
+      _po = HL;
+   }
+   Ann {* TesterCycle:3 *}
+   V {
+      _pi = N01;
+      _po = TX;
+   }
+}
+"""
+
+
+@pytest.fixture
+def stil_test(tmp_path) -> StilTest:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=STIL_HEADER + PATTERN_STR, newline="\n")
+    return parse_stil(directory=str(tmp_path), stil=stil)
+
+
+def test_get_cycle_event_list(stil_test: StilTest) -> None:
+    signal_index: StilSignalIndex = stil_test.signal_index
+    assert signal_index.get_cycle_event_list(signal_name="a", tester_cycle=1) == [(0, StilForce.UP)]
+    assert signal_index.get_cycle_event_list(signal_name="a", tester_cycle=2) == []
+    assert signal_index.get_cycle_event_list(signal_name="y", tester_cycle=2) == [(0, StilCompare.DONT_CARE), (40, StilCompare.HIGH)]
+    with pytest.raises(ValueError):
+        signal_index.get_cycle_event_list(signal_name="unknown", tester_cycle=0)
+
+
+def test_get_event_list(stil_test: StilTest) -> None:
+    # the end time is excluded
+    assert stil_test.signal_index.get_event_list(signal_name="y", start_time=0, end_time=240) == [
+        (0, StilCompare.DONT_CARE),
+        (40, StilCompare.LOW),
+        (200, StilCompare.DONT_CARE),
+    ]
+    assert stil_test.signal_index.get_event_list(signal_name="y", start_time=240, end_time=241) == [(240, StilCompare.HIGH)]
+
+
+def test_get_value_at_time(stil_test: StilTest) -> None:
+    signal_index: StilSignalIndex = stil_test.signal_index
+    assert signal_index.get_value_at_time(signal_name="a", time=-1) is None
+    assert signal_index.get_value_at_time(signal_name="a", time=99) == StilForce.DOWN
+    assert signal_index.get_value_at_time(signal_name="a", time=100) == StilForce.UP
+    assert signal_index.get_value_at_time(signal_name="y", time=239) == StilCompare.DONT_CARE
+    assert signal_index.get_value_at_time(signal_name="y", time=1000) == StilCompare.HIGH_IMPEDANCE
+
+
+def test_get_edge_list_and_toggle_count(stil_test: StilTest) -> None:
+    signal_index: StilSignalIndex = stil_test.signal_index
+    # none, don't care and high impedance events do not make edges
+    assert signal_index.get_edge_list(signal_name="a") == [(100, StilForce.UP)]
+    assert signal_index.get_edge_list(signal_name="y") == [(240, StilCompare.HIGH)]
+    assert signal_index.get_edge_list(signal_name="c") == [(300, StilForce.UP)]
+    assert signal_index.get_toggle_count(signal_name="a") == 1
+    assert signal_index.get_toggle_count(signal_name="b") == 1
+    assert signal_index.get_toggle_count(signal_name="c") == 1
+    assert signal_index.get_toggle_count(signal_name="z") == 1
+
+
+def test_signal_index_is_dropped(stil_test: StilTest) -> None:
+    signal_index: StilSignalIndex = stil_test.signal_index
+    assert stil_test.signal_index is signal_index
+    stil_test.add_test_vector(tester_cycle=4, signal_group_name="_pi", value_str="111")
+    assert stil_test.signal_index is not signal_index
+    assert stil_test.signal_index.get_cycle_event_list(signal_name="a", tester_cycle=4) == [(0, StilForce.UP)]
+
+    # events added on the test vector itself are only seen once the index is cleared
+    signal_index = stil_test.signal_index
+    stil_test.test_vector_dict[4].add_input_event(signal_group=stil_test.signal_group_dict["_pi"], value_list=[StilTimingInCondition.ZERO])
+    assert stil_test.signal_index is signal_index
+    stil_test.clear_signal_index()
+    assert stil_test.signal_index.get_cycle_event_list(signal_name="a", tester_cycle=4) == [(0, StilForce.UP), (0, StilForce.DOWN)]
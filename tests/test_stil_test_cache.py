@@ -0,0 +1,128 @@
+# standard packages
+import os
+from typing import List
+
+import pytest
+
+
+# local packages
+from stil_test import StilTest
+from stil_test_cache import StilTestCache
+from gen_stil import gen_stil_str, write_stil, parse_stil
+
+
+def test_cached_test_is_read_only(tmp_path) -> None:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=gen_stil_str(cycle_count=20), newline="\n")
+    stil_test_cache: StilTestCache = StilTestCache()
+    stil_test: StilTest = parse_stil(directory=str(tmp_path), stil=stil, stil_test_cache=stil_test_cache)
+    assert parse_stil(directory=str(tmp_path), stil=stil, stil_test_cache=stil_test_cache) is stil_test
+    test_str: str = stil_test.get_test_str()
+
+    signal_group = stil_test.signal_group_dict["_pi"]
+    with pytest.raises(AttributeError):
+        signal_group.remove_signal_from_name(signal_name="a")
+    with pytest.raises(AttributeError):
+        signal_group.add_signal(signal=stil_test.signal_dict["y"])
+    with pytest.raises(AttributeError):
+        signal_group.empty()
+    with pytest.raises(AttributeError):
+        signal_group.signal_list.append(stil_test.signal_dict["y"])
+
+    waveform_table = stil_test.waveform_table
+    with pytest.raises(TypeError):
+        waveform_table.waveform_dict["_pi"] = waveform_table.waveform_dict["_po"]
+    with pytest.raises(AttributeError):
+        waveform_table.add_waveform(waveform=waveform_table.waveform_dict["_pi"])
+
+    waveform = waveform_table.waveform_dict["_po"]
+    with pytest.raises(TypeError):
+        waveform.timestamp_dict[0] = []
+    with pytest.raises(AttributeError):
+        waveform.timestamp_dict[0].append(waveform.timestamp_dict[0][0])
+    with pytest.raises(AttributeError):
+        waveform.add_timestamp(timestamp_key=0, timestamp_value=waveform.timestamp_dict[0][0])
+
+    assert stil_test.get_test_str() == test_str
+
+
+def test_oversized_test_is_read_only(tmp_path) -> None:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=gen_stil_str(cycle_count=20), newline="\n")
+    stil_test_cache: StilTestCache = StilTestCache(memory_budget=1)
+    stil_test: StilTest = parse_stil(directory=str(tmp_path), stil=stil, stil_test_cache=stil_test_cache)
+    assert stil_test_cache.entry_count == 0
+    assert stil_test.read_only
+
+
+def test_signal_index_is_counted(tmp_path) -> None:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=gen_stil_str(cycle_count=20), newline="\n")
+    stil_test_cache: StilTestCache = StilTestCache()
+    stil_test: StilTest = parse_stil(directory=str(tmp_path), stil=stil, stil_test_cache=stil_test_cache)
+    memory_usage: int = stil_test_cache.memory_usage
+
+    signal_index_size: int = StilTestCache.estimate_signal_index_size(signal_index=stil_test.signal_index)
+    parse_stil(directory=str(tmp_path), stil=stil, stil_test_cache=stil_test_cache)
+    assert stil_test_cache.memory_usage == memory_usage + signal_index_size
+    # the index is only counted once
+    parse_stil(directory=str(tmp_path), stil=stil, stil_test_cache=stil_test_cache)
+    assert stil_test_cache.memory_usage == memory_usage + signal_index_size
+
+
+def parse_read_only_test(directory: str, seed: int) -> StilTest:
+    os.makedirs(directory)
+    stil: str = write_stil(directory=directory, stil_str=gen_stil_str(cycle_count=20, seed=seed), newline="\n")
+    stil_test: StilTest = parse_stil(directory=directory, stil=stil)
+    # the cache freezes the tests it is given, freezing them first gives the size the cache counts
+    stil_test.set_read_only()
+    return stil_test
+
+
+def test_least_recently_used_is_evicted(tmp_path) -> None:
+    file_path_list: List[str] = [f"{tmp_path}/{seed}/gen_test.stil" for seed in range(3)]
+    stil_test_list: List[StilTest] = [parse_read_only_test(directory=f"{tmp_path}/{seed}", seed=seed) for seed in range(3)]
+    test_size_list: List[int] = [StilTestCache.estimate_test_size(stil_test=stil_test) for stil_test in stil_test_list]
+    # the three tests do not fit together, any two of them do
+    stil_test_cache: StilTestCache = StilTestCache(memory_budget=sum(test_size_list) - 1)
+
+    stil_test_cache.add_test(file_path=file_path_list[0], stil_test=stil_test_list[0])
+    stil_test_cache.add_test(file_path=file_path_list[1], stil_test=stil_test_list[1])
+    assert stil_test_cache.memory_usage == test_size_list[0] + test_size_list[1]
+    # the hit makes the first test the most recently used, so the second one is evicted
+    assert stil_test_cache.get_test(file_path=file_path_list[0]) is stil_test_list[0]
+    stil_test_cache.add_test(file_path=file_path_list[2], stil_test=stil_test_list[2])
+
+    assert stil_test_cache.entry_count == 2
+    assert stil_test_cache.eviction_count == 1
+    assert stil_test_cache.memory_usage == test_size_list[0] + test_size_list[2]
+    assert stil_test_cache.memory_usage <= stil_test_cache.memory_budget
+    assert stil_test_cache.get_test(file_path=file_path_list[1]) is None
+    assert stil_test_cache.get_test(file_path=file_path_list[2]) is stil_test_list[2]
+    assert stil_test_cache.get_test(file_path=file_path_list[0]) is stil_test_list[0]
+    assert (stil_test_cache.hit_count, stil_test_cache.miss_count) == (3, 1)
+
+    # the second test evicts the third one, which is now the least recently used
+    stil_test_cache.add_test(file_path=file_path_list[1], stil_test=stil_test_list[1])
+    assert stil_test_cache.eviction_count == 2
+    assert stil_test_cache.get_test(file_path=file_path_list[2]) is None
+    assert stil_test_cache.get_test(file_path=file_path_list[0]) is stil_test_list[0]
+    assert stil_test_cache.get_test(file_path=file_path_list[1]) is stil_test_list[1]
+    assert (stil_test_cache.hit_count, stil_test_cache.miss_count) == (5, 2)
+
+
+def test_newer_file_replaces_entry(tmp_path) -> None:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=gen_stil_str(cycle_count=20), newline="\n")
+    file_path: str = f"{tmp_path}/{stil}.stil"
+    stil_test_cache: StilTestCache = StilTestCache()
+    stil_test: StilTest = parse_stil(directory=str(tmp_path), stil=stil, stil_test_cache=stil_test_cache)
+    assert stil_test_cache.miss_count == 1
+
+    stil_stat: os.stat_result = os.stat(file_path)
+    os.utime(file_path, ns=(stil_stat.st_atime_ns, stil_stat.st_mtime_ns + 10**9))
+    newer_test: StilTest = parse_stil(directory=str(tmp_path), stil=stil, stil_test_cache=stil_test_cache)
+    assert newer_test is not stil_test
+    assert stil_test_cache.miss_count == 2
+    # the older entry is dropped rather than evicted
+    assert stil_test_cache.entry_count == 1
+    assert stil_test_cache.eviction_count == 0
+    assert stil_test_cache.memory_usage == StilTestCache.estimate_test_size(stil_test=newer_test)
+    assert parse_stil(directory=str(tmp_path), stil=stil, stil_test_cache=stil_test_cache) is newer_test
+    assert stil_test_cache.hit_count == 1
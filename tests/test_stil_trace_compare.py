@@ -0,0 +1,112 @@
+# standard packages
+from typing import List, Tuple
+
+
+# local packages
+from stil_test import StilTest
+from stil_trace import StilTrace
+from stil_trace_compare import StilTraceCompare, StilCompareResult
+from stil_waveform import StilCompare, StilUnits
+from gen_stil import STIL_HEADER, write_stil, parse_stil
+
+
+# y and z are compared at 40ns in each 100ns cycle, X is not compared
+PATTERN_STR: str = """   Ann {* TesterCycle:0 *}
+   V {
+      _pi = 010;
+      _po = LH;
+   }
+   Ann {* TesterCycle:1 *}
+   V {
+      _po = HL;
+   }
+   Ann {* TesterCycle:2 *}
+   V {
+      _po = TX;
+   }
+   Ann {* TesterCycle:3 *}
+   V {
+      _po = LL;
+   }
+}
+"""
+
+
+# times are in 100ps units, the trace is compared 5ns after each cycle start,
+# y is 'x' instead of 'z' in cycle 2 and z is '1' instead of '0' in cycle 3
+VCD_STR: str = """$date handwritten $end
+$version none $end
+$timescale
+   100 ps
+$end
+$scope module tb $end
+$var wire 1 ! y $end
+$var wire 1 " z $end
+$var wire 8 # bus $end
+$var wire 1 $ a $end
+$upscope $end
+$enddefinitions $end
+#0
+$dumpvars
+0!
+1"
+b00000000 #
+x$
+$end
+#1000
+1!
+0"
+#2000
+z!
+#2400
+x!
+#3000
+0!
+1"
+"""
+
+
+def gen_stil_test(tmp_path) -> StilTest:
+    stil: str = write_stil(directory=str(tmp_path), stil_str=STIL_HEADER + PATTERN_STR, newline="\n")
+    return parse_stil(directory=str(tmp_path), stil=stil)
+
+
+def test_gen_trace_from_vcd(tmp_path) -> None:
+    (tmp_path / "trace.vcd").write_text(VCD_STR)
+    stil_trace: StilTrace = StilTrace.gen_trace_from_vcd(file_path=str(tmp_path / "trace.vcd"))
+    assert (stil_trace.timescale, stil_trace.units) == (100, StilUnits.PS)
+    # the 8-bit bus is not a scalar and is dropped
+    assert list(stil_trace.time_array_dict.keys()) == ["y", "z", "a"]
+    assert list(stil_trace.time_array_dict["y"]) == [0, 1000, 2000, 2400, 3000]
+    assert stil_trace.value_str_dict["y"] == "01zx0"
+    assert stil_trace.get_value(signal_name="z", time=-1) == "x"
+    assert stil_trace.get_value(signal_name="z", time=999) == "1"
+    assert stil_trace.get_value(signal_name="z", time=1000) == "0"
+
+
+def test_compare_trace(tmp_path) -> None:
+    (tmp_path / "trace.vcd").write_text(VCD_STR)
+    stil_trace: StilTrace = StilTrace.gen_trace_from_vcd(file_path=str(tmp_path / "trace.vcd"))
+    compare_result: StilCompareResult = StilTraceCompare.compare_trace(stil_test=gen_stil_test(tmp_path), stil_trace=stil_trace, time_offset=5)
+
+    assert not compare_result.passed
+    assert compare_result.compare_count == 7
+    assert compare_result.failure_count_dict == {"y": 1, "z": 1}
+    mismatch_list: List[Tuple[int, int, str, StilCompare, str]] = [
+        (mismatch.tester_cycle, mismatch.timestamp, mismatch.signal_name, mismatch.expected, mismatch.actual)
+        for mismatch in compare_result.mismatch_list
+    ]
+    assert mismatch_list == [
+        (2, 40, "y", StilCompare.HIGH_IMPEDANCE, "x"),
+        (3, 40, "z", StilCompare.LOW, "1"),
+    ]
+
+
+def test_compare_trace_passes(tmp_path) -> None:
+    stil_trace: StilTrace = StilTrace(timescale=1, units=StilUnits.NS)
+    stil_trace.add_signal_trace(signal_name="y", time_list=[0, 100, 200, 300], value_list="01z0")
+    stil_trace.add_signal_trace(signal_name="z", time_list=[0, 100, 300], value_list="100")
+    compare_result: StilCompareResult = StilTraceCompare.compare_trace(stil_test=gen_stil_test(tmp_path), stil_trace=stil_trace)
+    assert compare_result.passed
+    assert compare_result.compare_count == 7
+    assert compare_result.failure_count_dict == {"y": 0, "z": 0}